@@ -2,14 +2,27 @@
 NFL Social Content Generator - Main Flask Application
 Phase 1: MVP with manual context input
 """
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, render_template, request, jsonify, send_file
+import io
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from werkzeug.utils import secure_filename
 import pandas as pd
 
-from modules import CSVProcessor, MoversAnalyzer, TweetGenerator
+from modules import CSVProcessor, MoversAnalyzer, TweetGenerator, ContextFetcher, BoardStore
+from modules.draft_pager import LazyDraftBatch
+from modules.live_board import LiveBoard
+from modules.live_ingest import DirectoryFeed, TailFeed, EventBroker, LiveIngestor
+from modules.result_cache import ResultCache
+from modules.movers_query import MoversQuery
+from modules.single_flight import SingleFlight, OverloadedError
+from modules.profiling import profiler
+from modules.compressed_upload import open_csv_stream
+from modules.warm_pipeline import WarmCache
+from modules.draft_index import DraftIndex
+from modules.share_cards import write_bundle
 import config
 
 app = Flask(__name__)
@@ -17,6 +30,10 @@ app.config['SECRET_KEY'] = config.SECRET_KEY
 app.config['UPLOAD_FOLDER'] = config.UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = config.MAX_FILE_SIZE
 
+# Opt-in request/stage profiling (no-op unless enabled or triggered by header)
+profiler.configure(config.get_profiling_config())
+profiler.init_app(app)
+
 # Ensure upload and export folders exist
 os.makedirs(config.UPLOAD_FOLDER, exist_ok=True)
 os.makedirs(config.EXPORT_FOLDER, exist_ok=True)
@@ -24,11 +41,149 @@ os.makedirs(config.EXPORT_FOLDER, exist_ok=True)
 # Global variables to store session data
 current_data = {
     'df': None,
+    'board_id': None,
+    'fingerprint': None,
     'movers': None,
+    'movers_key': None,
+    'movers_query': None,
     'results': None,
-    'filename': None
+    'drafts': None,
+    'filename': None,
+    'live': None,
+    'store_write': None
 }
 
+# Shared context fetcher so its TTL cache survives across requests
+context_fetcher = ContextFetcher.from_config(config.get_config()) if config.CONTEXT_FETCH_ENABLED else None
+
+# Cleaned boards are written once and memory-mapped by every worker
+board_store = None
+if config.BOARD_STORE_ENABLED:
+    try:
+        board_store = BoardStore(config.BOARD_STORE_FOLDER, keep=config.BOARD_STORE_KEEP)
+    except OSError:
+        # Read-only filesystem (e.g. serverless) - keep boards in worker memory
+        board_store = None
+
+# Identical concurrent analyze/generate calls share one computation
+request_flights = SingleFlight(
+    max_concurrent=config.MAX_CONCURRENT_COMPUTATIONS,
+    max_queued=config.MAX_QUEUED_COMPUTATIONS,
+    timeout=config.COMPUTATION_TIMEOUT
+)
+
+# Past drafts for near-duplicate flags and variation rotation
+draft_index = DraftIndex(
+    config.DRAFT_INDEX_FILE,
+    threshold=config.DUPLICATE_THRESHOLD,
+    max_age_days=config.DRAFT_INDEX_MAX_AGE_DAYS
+) if config.DRAFT_INDEX_ENABLED else None
+
+# Rendered results per mover, so regenerating only renders movers whose inputs changed
+result_cache = ResultCache(config.RESULT_CACHE_SIZE)
+
+# Patched boards from delta uploads are written to the store off the request path
+store_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='board-store') if board_store is not None else None
+
+# Live ingestion (started via /api/live/start or LIVE_AUTOSTART)
+live_ingestor = None
+
+# Default analyze/generate results precomputed in the background after upload
+warm_cache = WarmCache(max_workers=config.WARM_WORKERS) if config.WARM_ON_UPLOAD else None
+
+
+def get_board():
+    """Get the loaded board, opening the shared stored board if this worker has none"""
+    if board_store is not None:
+        board_id = board_store.current_id()
+        # Until this worker's patched board is stored, CURRENT still names its base
+        pending = current_data['store_write']
+        if pending is not None and not (pending.done() and pending.exception() is None and pending.result()):
+            return current_data['df']
+        if board_id is not None and board_id != current_data['board_id']:
+            df = board_store.open_current()
+            if df is not None:
+                current_data['df'] = df
+                current_data['board_id'] = df.attrs['board_id']
+                current_data['fingerprint'] = df.attrs['board_id']
+                current_data['filename'] = df.attrs.get('source_file')
+    return current_data['df']
+
+
+def get_live_board():
+    """Get the patchable copy of the loaded board (built on the first delta upload)"""
+    board = get_board()
+    if board is None:
+        return None
+    live = current_data['live']
+    if live is None or live.board_id != current_data['fingerprint']:
+        live = current_data['live'] = LiveBoard(board, current_data['fingerprint'])
+    return live
+
+
+def persist_live_board(live, filename):
+    """Write a patched board to the shared store (runs on store_writer)"""
+    try:
+        df, board_id = live.snapshot()
+        board_store.write(df, filename, board_id=board_id)
+        return True
+    except OSError:
+        return False
+
+
+def compute_analysis(board, threshold, top_n):
+    """Analyze movers and get summary"""
+    live = current_data['live']
+    if live is not None and board.attrs.get('board_id') == live.board_id:
+        # Patched board keeps its rankings up to date
+        movers, summary = live.analysis(threshold, top_n)
+        return movers, summary, MoversQuery(movers)
+
+    analyzer = MoversAnalyzer(board, {
+        'movement_threshold': threshold,
+        'top_n_movers': top_n
+    })
+    movers = analyzer.identify_movers()
+    return movers, analyzer.get_movers_summary(), MoversQuery(movers)
+
+
+def compute_drafts(movers, contexts, lazy, source_id=None):
+    """Generate tweet drafts (or a lazy draft batch) for movers"""
+    if draft_index is not None:
+        draft_index.refresh()
+    generator = TweetGenerator(config.get_config(), context_fetcher, draft_index, source_id, result_cache)
+    if lazy:
+        return LazyDraftBatch(generator, movers, contexts, cache_size=config.DRAFT_CACHE_SIZE)
+
+    return generator.generate_batch(movers, contexts)
+
+
+def generate_key(movers_key, contexts, lazy):
+    """Coalescing key for a generate computation"""
+    return ('generate', movers_key, json.dumps(contexts, sort_keys=True), lazy)
+
+
+def run_computation(key, fn, *args):
+    """Use a warm (finished or in-flight) result once if upload precomputed one, else compute coalesced"""
+    future = warm_cache.get(key) if warm_cache is not None else None
+    if future is not None:
+        try:
+            return future.result(timeout=config.COMPUTATION_TIMEOUT)
+        except Exception:
+            pass
+    return request_flights.do(key, lambda: fn(*args))
+
+
+def warm_up(board, fingerprint):
+    """Precompute default movers, summary and drafts for a freshly uploaded board"""
+    warm_cache.reset()
+    movers_key = (fingerprint, float(config.MOVEMENT_THRESHOLD), int(config.TOP_N_MOVERS))
+    analysis = warm_cache.submit(('analyze',) + movers_key, compute_analysis, board, *movers_key[1:])
+    warm_cache.submit(
+        generate_key(movers_key, {}, False),
+        lambda: compute_drafts(analysis.result()[0], {}, False, fingerprint)
+    )
+
 
 def allowed_file(filename):
     """Check if file extension is allowed"""
@@ -42,33 +197,75 @@ def index():
     return render_template('index.html')
 
 
-@app.route('/api/upload', methods=['POST'])
-def upload_file():
-    """Handle CSV file upload"""
+def read_upload():
+    """
+    Validate the uploaded file and run it through CSVProcessor
+
+    Returns:
+        (filename, processor, None) on success, or (None, None, error response)
+    """
     if 'file' not in request.files:
-        return jsonify({'error': 'No file provided'}), 400
+        return None, None, (jsonify({'error': 'No file provided'}), 400)
 
     file = request.files['file']
 
     if file.filename == '':
-        return jsonify({'error': 'No file selected'}), 400
+        return None, None, (jsonify({'error': 'No file selected'}), 400)
 
     if not allowed_file(file.filename):
-        return jsonify({'error': 'Only CSV files allowed'}), 400
+        return None, None, (jsonify({'error': 'Only CSV files (optionally .gz, .zst or .zip compressed) allowed'}), 400)
 
+    # Process CSV directly from memory (no disk write needed)
+    # This works in serverless environments like Vercel
+    # Compressed uploads are inflated as a stream while pandas reads them
     try:
-        filename = secure_filename(file.filename)
+        stream = open_csv_stream(
+            file.stream, file.filename,
+            max_bytes=config.MAX_DECOMPRESSED_SIZE,
+            max_ratio=config.MAX_DECOMPRESSION_RATIO
+        )
+    except (ValueError, OSError) as e:
+        return None, None, (jsonify({'error': f'Could not read compressed upload: {str(e)}'}), 400)
 
-        # Process CSV directly from memory (no disk write needed)
-        # This works in serverless environments like Vercel
-        processor = CSVProcessor(file_object=file)
-        if not processor.process():
-            errors = processor.get_errors()
-            return jsonify({'error': f'CSV processing failed: {", ".join(errors)}'}), 400
+    processor = CSVProcessor(file_object=stream, max_rows=config.MAX_ROWS)
+    if not processor.process():
+        errors = processor.get_errors()
+        return None, None, (jsonify({'error': f'CSV processing failed: {", ".join(errors)}'}), 400)
 
-        # Store data globally
-        current_data['df'] = processor.get_data()
+    return secure_filename(file.filename), processor, None
+
+
+@app.route('/api/upload', methods=['POST'])
+def upload_file():
+    """Handle CSV file upload"""
+    try:
+        filename, processor, error = read_upload()
+        if error is not None:
+            return error
+
+        # Store data globally (memory-mapped shared copy when the store is available)
+        df = processor.get_data()
+        current_data['df'] = df
+        current_data['board_id'] = None
+        current_data['fingerprint'] = None
         current_data['filename'] = filename
+        current_data['live'] = None
+        current_data['store_write'] = None
+        if board_store is not None:
+            try:
+                board_id = board_store.write(df, filename)
+                current_data['df'] = board_store.open(board_id)
+                current_data['board_id'] = board_id
+                current_data['fingerprint'] = board_id
+            except OSError:
+                # Keep this worker's in-memory copy rather than an older shared board
+                current_data['board_id'] = board_store.current_id()
+        if current_data['fingerprint'] is None:
+            current_data['fingerprint'] = BoardStore.fingerprint(df)
+
+        # Start computing what the next two clicks will ask for
+        if warm_cache is not None:
+            warm_up(current_data['df'], current_data['fingerprint'])
 
         # Get summary
         summary = processor.get_summary()
@@ -76,59 +273,142 @@ def upload_file():
         return jsonify({
             'success': True,
             'filename': filename,
-            'summary': summary
+            'summary': summary,
+            'validation': processor.get_validation_report()
         })
 
     except Exception as e:
         return jsonify({'error': f'Upload failed: {str(e)}'}), 500
 
 
+@app.route('/api/upload/delta', methods=['POST'])
+def upload_delta():
+    """Patch the loaded board with changed (market, team_player) rows"""
+    if get_board() is None:
+        return jsonify({'error': 'No data loaded. Please upload the full CSV first.'}), 400
+
+    try:
+        filename, processor, error = read_upload()
+        if error is not None:
+            return error
+
+        live = get_live_board()
+        changes = live.apply(processor.get_data())
+
+        current_data['df'] = live.frame()
+        current_data['board_id'] = live.board_id
+        current_data['fingerprint'] = live.board_id
+        current_data['results'] = None
+        current_data['drafts'] = None
+
+        # Other workers pick the patched board up from the store once it's written
+        if board_store is not None and changes['updated'] + changes['inserted']:
+            current_data['store_write'] = store_writer.submit(persist_live_board, live, current_data['filename'])
+
+        response = {
+            'success': True,
+            'filename': filename,
+            'delta': changes,
+            'summary': live.board_summary(),
+            'validation': processor.get_validation_report()
+        }
+
+        # Re-rank the last analysis incrementally
+        if current_data['movers_key'] is not None:
+            _, threshold, top_n = current_data['movers_key']
+            movers, movers_summary = live.analysis(threshold, top_n)
+            current_data['movers'] = movers
+            current_data['movers_key'] = (live.board_id, threshold, top_n)
+            current_data['movers_query'] = MoversQuery(movers)
+            response['movers'] = format_movers_for_display(movers.to_dict('records'))
+            response['movers_summary'] = movers_summary
+
+        return jsonify(response)
+
+    except Exception as e:
+        return jsonify({'error': f'Delta upload failed: {str(e)}'}), 500
+
+
 @app.route('/api/analyze', methods=['POST'])
 def analyze_movers():
     """Analyze data to find biggest movers"""
-    if current_data['df'] is None:
+    if get_board() is None:
         return jsonify({'error': 'No data loaded. Please upload CSV first.'}), 400
 
     try:
         # Get configuration from request or use defaults
         data = request.get_json() or {}
-        threshold = data.get('threshold', config.MOVEMENT_THRESHOLD)
-        top_n = data.get('top_n', config.TOP_N_MOVERS)
-
-        # Create config dict
-        analyzer_config = {
-            'movement_threshold': threshold,
-            'top_n_movers': top_n
-        }
+        try:
+            threshold = float(data.get('threshold', config.MOVEMENT_THRESHOLD))
+            top_n = int(data.get('top_n', config.TOP_N_MOVERS))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'threshold and top_n must be numbers'}), 400
 
-        # Analyze movers
-        analyzer = MoversAnalyzer(current_data['df'], analyzer_config)
-        movers = analyzer.identify_movers()
+        movers_key = (current_data['fingerprint'], threshold, top_n)
+        movers, summary, movers_query = run_computation(
+            ('analyze',) + movers_key, compute_analysis, current_data['df'], threshold, top_n
+        )
 
         # Store movers
         current_data['movers'] = movers
-
-        # Get summary
-        summary = analyzer.get_movers_summary()
-
-        # Convert movers to list of dicts for JSON
-        movers_list = movers.to_dict('records')
-
-        # Format for display
-        for mover in movers_list:
-            mover['last_week_american'] = format_american_odds(mover['last_week_american'])
-            mover['this_week_american'] = format_american_odds(mover['this_week_american'])
+        current_data['movers_key'] = movers_key
+        current_data['movers_query'] = movers_query
+
+        # Paginated response when the client asks for a page size
+        if 'limit' in data:
+            try:
+                page = current_data['movers_query'].page(
+                    limit=data['limit'],
+                    cursor=data.get('cursor'),
+                    sort=data.get('sort'),
+                    order=data.get('order'),
+                    market=data.get('market'),
+                    direction=data.get('direction'),
+                    magnitude=data.get('magnitude')
+                )
+            except (TypeError, ValueError) as e:
+                return jsonify({'error': str(e) if isinstance(e, ValueError) else 'limit must be an integer'}), 400
+            page['movers'] = format_movers_for_display(page['movers'])
+            page['markets'] = current_data['movers_query'].markets()
+            page.update({'success': True, 'summary': summary})
+            return jsonify(page)
 
         return jsonify({
             'success': True,
-            'movers': movers_list,
+            'movers': format_movers_for_display(movers.to_dict('records')),
             'summary': summary
         })
 
+    except OverloadedError as e:
+        return overloaded_response(e)
     except Exception as e:
         return jsonify({'error': f'Analysis failed: {str(e)}'}), 500
 
 
+@app.route('/api/movers', methods=['GET'])
+def list_movers():
+    """Page through analyzed movers (cursor pagination, sorting and filtering)"""
+    if current_data['movers_query'] is None:
+        return jsonify({'error': 'No movers analyzed. Please analyze data first.'}), 400
+
+    try:
+        page = current_data['movers_query'].page(
+            limit=request.args.get('limit', config.MOVERS_PAGE_SIZE, type=int),
+            cursor=request.args.get('cursor'),
+            sort=request.args.get('sort'),
+            order=request.args.get('order'),
+            market=request.args.get('market'),
+            direction=request.args.get('direction'),
+            magnitude=request.args.get('magnitude')
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    page['movers'] = format_movers_for_display(page['movers'])
+    page['success'] = True
+    return jsonify(page)
+
+
 @app.route('/api/generate', methods=['POST'])
 def generate_tweets():
     """Generate tweet drafts for movers"""
@@ -140,30 +420,99 @@ def generate_tweets():
         data = request.get_json() or {}
         contexts = data.get('contexts', {})
 
-        # Get config
-        generator_config = config.get_config()
-
         # Generate tweets
-        generator = TweetGenerator(generator_config)
-        results = generator.generate_batch(current_data['movers'], contexts)
+        lazy = bool(data.get('lazy'))
+        key = generate_key(current_data['movers_key'], contexts, lazy)
+        output = run_computation(key, compute_drafts, current_data['movers'], contexts, lazy,
+                                 current_data['fingerprint'])
+
+        if lazy:
+            # Return mover metadata and draft handles; drafts render on request
+            current_data['drafts'] = output
+            current_data['results'] = None
+
+            return jsonify({
+                'success': True,
+                'lazy': True,
+                'batch_id': output.batch_id,
+                'movers': output.summary(),
+                'count': len(output.entries)
+            })
 
         # Store results
-        current_data['results'] = results
+        current_data['results'] = output
+        current_data['drafts'] = None
 
         return jsonify({
             'success': True,
-            'results': results,
-            'count': len(results)
+            'results': output,
+            'count': len(output)
         })
 
+    except OverloadedError as e:
+        return overloaded_response(e)
     except Exception as e:
         return jsonify({'error': f'Tweet generation failed: {str(e)}'}), 500
 
 
+@app.route('/api/drafts', methods=['GET'])
+def list_drafts():
+    """Render one page of lazily generated drafts (filter by market, direction, magnitude)"""
+    batch = current_data['drafts']
+    if batch is None:
+        return jsonify({'error': 'No lazy drafts. Please generate with lazy mode first.'}), 400
+
+    try:
+        page = batch.page(
+            page=request.args.get('page', 1, type=int),
+            per_page=request.args.get('per_page', config.DRAFTS_PER_PAGE, type=int),
+            market=request.args.get('market'),
+            direction=request.args.get('direction'),
+            magnitude=request.args.get('magnitude')
+        )
+        page['success'] = True
+        page['batch_id'] = batch.batch_id
+        return jsonify(page)
+
+    except Exception as e:
+        return jsonify({'error': f'Draft rendering failed: {str(e)}'}), 500
+
+
+@app.route('/api/drafts/<handle>', methods=['GET'])
+def get_draft(handle):
+    """Render a single lazily generated draft"""
+    batch = current_data['drafts']
+    if batch is None:
+        return jsonify({'error': 'No lazy drafts. Please generate with lazy mode first.'}), 400
+
+    draft = batch.get_draft(handle)
+    if draft is None:
+        return jsonify({'error': f'Unknown draft: {handle}'}), 404
+
+    return jsonify({'success': True, 'draft': draft})
+
+
+def build_export_data():
+    """Materialize results, record them as exported and build the export payload"""
+    results = current_data['results'] if current_data['results'] is not None \
+        else current_data['drafts'].materialize_all()
+
+    # Exported copy is what gets posted - remember it for duplicate checks and rotation
+    if draft_index is not None:
+        draft_index.record(results, current_data['fingerprint'])
+
+    return {
+        'generated_at': datetime.now().isoformat(),
+        'source_file': current_data['filename'],
+        'config': config.get_config(),
+        'results': results
+    }
+
+
 @app.route('/api/export', methods=['POST'])
 def export_results():
     """Export generated tweets to JSON (returns data directly for serverless compatibility)"""
-    if current_data['results'] is None:
+    if current_data['results'] is None and current_data['drafts'] is None:
         return jsonify({'error': 'No results to export. Please generate tweets first.'}), 400
 
     try:
@@ -171,13 +520,7 @@ def export_results():
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f'tweets_{timestamp}.json'
 
-        # Prepare export data
-        export_data = {
-            'generated_at': datetime.now().isoformat(),
-            'source_file': current_data['filename'],
-            'config': config.get_config(),
-            'results': current_data['results']
-        }
+        export_data = build_export_data()
 
         # In serverless environments (Vercel), return data directly
         # User can save the JSON from the response
@@ -191,6 +534,30 @@ def export_results():
         return jsonify({'error': f'Export failed: {str(e)}'}), 500
 
 
+@app.route('/api/export/bundle', methods=['POST'])
+def export_bundle():
+    """Export tweets plus a share-card image per mover as a zip (built in memory)"""
+    if current_data['results'] is None and current_data['drafts'] is None:
+        return jsonify({'error': 'No results to export. Please generate tweets first.'}), 400
+
+    try:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        bundle = io.BytesIO()
+        write_bundle(
+            build_export_data(), bundle,
+            font_path=config.SHARE_CARD_FONT or None,
+            logo_path=config.SHARE_CARD_LOGO or None,
+            template_folder=config.TEMPLATE_FOLDER,
+            workers=1  # In-process with the cached renderer; pool processes would re-import the app
+        )
+        bundle.seek(0)
+        return send_file(bundle, mimetype='application/zip', as_attachment=True,
+                         download_name=f'tweets_{timestamp}.zip')
+
+    except Exception as e:
+        return jsonify({'error': f'Export failed: {str(e)}'}), 500
+
+
 @app.route('/api/download/<filename>')
 def download_file(filename):
     """Download exported file"""
@@ -201,6 +568,92 @@ def download_file(filename):
         return jsonify({'error': f'Download failed: {str(e)}'}), 404
 
 
+def start_live(threshold, top_n, seed):
+    """Start live ingestion, optionally from the loaded board"""
+    global live_ingestor
+    feeds = [DirectoryFeed(config.LIVE_WATCH_FOLDER)]
+    if config.LIVE_FEED_FILE:
+        feeds.append(TailFeed(config.LIVE_FEED_FILE))
+
+    board = None
+    if seed and get_board() is not None:
+        board = LiveBoard(current_data['df'], current_data['fingerprint'])
+
+    # No context fetching here - live updates have to render in milliseconds
+    generator = TweetGenerator(config.get_config(), None, draft_index, None, result_cache)
+    live_ingestor = LiveIngestor(
+        feeds, generator, threshold, top_n, board,
+        broker=EventBroker(config.LIVE_QUEUE_SIZE, config.LIVE_REPLAY_EVENTS),
+        poll_interval=config.LIVE_POLL_INTERVAL
+    )
+    live_ingestor.start()
+    return live_ingestor
+
+
+@app.route('/api/live/start', methods=['POST'])
+def live_start():
+    """Start watching the live feeds"""
+    if live_ingestor is not None and live_ingestor.running:
+        return jsonify({'error': 'Live mode is already running. Stop it first.'}), 409
+
+    try:
+        data = request.get_json(silent=True) or {}
+        threshold = float(data.get('threshold', config.MOVEMENT_THRESHOLD))
+        top_n = int(data.get('top_n', config.TOP_N_MOVERS))
+        ingestor = start_live(threshold, top_n, bool(data.get('seed', True)))
+        return jsonify({'success': True, 'status': ingestor.status(), 'snapshot': ingestor.snapshot()})
+    except Exception as e:
+        return jsonify({'error': f'Could not start live mode: {str(e)}'}), 500
+
+
+@app.route('/api/live/stop', methods=['POST'])
+def live_stop():
+    """Stop live ingestion and close event streams"""
+    if live_ingestor is None or not live_ingestor.running:
+        return jsonify({'error': 'Live mode is not running.'}), 400
+
+    live_ingestor.stop()
+    return jsonify({'success': True, 'status': live_ingestor.status()})
+
+
+@app.route('/api/live/status', methods=['GET'])
+def live_status():
+    """Live ingestion state, latency counters and current top movers"""
+    if live_ingestor is None:
+        return jsonify({'success': True, 'status': {'running': False}})
+
+    return jsonify({'success': True, 'status': live_ingestor.status(), 'snapshot': live_ingestor.snapshot()})
+
+
+@app.route('/api/live/stream', methods=['GET'])
+def live_stream():
+    """Server-Sent Events: a snapshot, then 'mover', 'update' and 'error' events"""
+    if live_ingestor is None or not live_ingestor.running:
+        return jsonify({'error': 'Live mode is not running.'}), 400
+
+    ingestor = live_ingestor
+    last_event_id = request.headers.get('Last-Event-ID', type=int)
+    subscription = ingestor.broker.subscribe(last_event_id)
+
+    def stream():
+        try:
+            # Reconnecting clients get the missed events instead of a fresh snapshot
+            if last_event_id is None:
+                yield EventBroker.format_sse({'id': 0, 'type': 'snapshot', 'data': ingestor.snapshot()})
+            while True:
+                event = subscription.get(timeout=config.LIVE_HEARTBEAT)
+                if event is None:
+                    break
+                yield EventBroker.format_sse(event) if event else ': keep-alive\n\n'
+        finally:
+            ingestor.broker.unsubscribe(subscription)
+
+    return Response(stream(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+
 @app.route('/api/config', methods=['GET'])
 def get_config():
     """Get current configuration"""
@@ -215,6 +668,22 @@ def update_config():
     return jsonify({'message': 'Config update not implemented in MVP'})
 
 
+def overloaded_response(error):
+    """429 response telling the client when to retry"""
+    response = jsonify({'error': str(error), 'retry_after': error.retry_after})
+    response.status_code = 429
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response
+
+
+def format_movers_for_display(movers_list):
+    """Format mover records for JSON display"""
+    for mover in movers_list:
+        mover['last_week_american'] = format_american_odds(mover['last_week_american'])
+        mover['this_week_american'] = format_american_odds(mover['this_week_american'])
+    return movers_list
+
+
 def format_american_odds(odds):
     """Format American odds with +/- sign"""
     try:
@@ -224,5 +693,9 @@ def format_american_odds(odds):
         return str(odds)
 
 
+if config.LIVE_AUTOSTART:
+    start_live(config.MOVEMENT_THRESHOLD, config.TOP_N_MOVERS, seed=False)
+
+
 if __name__ == '__main__':
     app.run(host=config.HOST, port=config.PORT, debug=config.DEBUG)
@@ -0,0 +1,273 @@
+"""
+NFL Social Content Generator - Command Line Batch Runner
+Runs the CSV -> movers -> tweets pipeline without the Flask app
+
+Usage:
+    python cli.py data/sample_odds.csv
+    python cli.py data/boards/ --threshold 3 --top-n 15 --variations 2
+    python cli.py data/sample_odds.csv --cards
+    cat board.csv | python cli.py -
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from modules import CSVProcessor, MoversAnalyzer, TweetGenerator, ContextFetcher
+from modules.profiling import profiler
+from modules.share_cards import write_bundle
+import config
+
+STDIN_SOURCE = '-'
+
+
+def collect_sources(paths: List[str]) -> List[str]:
+    """
+    Expand input paths into a list of CSV sources
+
+    Args:
+        paths: Files, directories, or '-' for stdin
+
+    Returns:
+        Sorted list of CSV file paths (with '-' kept as-is)
+    """
+    sources = []
+    for path in paths:
+        if path == STDIN_SOURCE:
+            sources.append(STDIN_SOURCE)
+        elif os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                full_path = os.path.join(path, name)
+                if os.path.isfile(full_path) and _is_csv(name):
+                    sources.append(full_path)
+        else:
+            sources.append(path)
+    return sources
+
+
+def _is_csv(filename: str) -> bool:
+    """Check if file extension is an allowed upload type"""
+    return '.' in filename and \
+           filename.rsplit('.', 1)[1].lower() in config.ALLOWED_EXTENSIONS
+
+
+def run_pipeline(source: str, options: Dict, stdin_data: Optional[str] = None) -> Dict:
+    """
+    Run the full pipeline for one CSV source
+
+    Args:
+        source: Path to CSV file, or '-' when reading stdin_data
+        options: Analyzer/generator settings and output folder
+        stdin_data: CSV text read from stdin (only for '-')
+
+    Returns:
+        Summary dictionary with status, counts, timings and output path
+    """
+    profiler.configure(config.get_profiling_config())
+    started = time.perf_counter()
+    timings = {}
+    summary = {'source': source, 'success': False, 'timings': timings}
+
+    try:
+        # Stage 1: load and clean
+        stage_start = time.perf_counter()
+        if source == STDIN_SOURCE:
+            processor = CSVProcessor(file_object=io.StringIO(stdin_data or ''))
+        else:
+            processor = CSVProcessor(file_path=source)
+        ok = processor.process()
+        timings['process'] = _elapsed_ms(stage_start)
+        if not ok:
+            summary['error'] = f'CSV processing failed: {", ".join(processor.get_errors())}'
+            return summary
+
+        # Stage 2: analyze movers
+        stage_start = time.perf_counter()
+        analyzer = MoversAnalyzer(processor.get_data(), {
+            'movement_threshold': options['threshold'],
+            'top_n_movers': options['top_n']
+        })
+        movers = analyzer.identify_movers()
+        movers_summary = analyzer.get_movers_summary()
+        timings['analyze'] = _elapsed_ms(stage_start)
+
+        # Stage 3: generate tweets
+        stage_start = time.perf_counter()
+        generator_config = config.get_config()
+        generator_config.update({
+            'movement_threshold': options['threshold'],
+            'top_n_movers': options['top_n'],
+            'tweet_variations': options['variations']
+        })
+        fetcher = ContextFetcher.from_config(generator_config) if config.CONTEXT_FETCH_ENABLED else None
+        generator = TweetGenerator(generator_config, fetcher)
+        results = generator.generate_batch(movers)
+        timings['generate'] = _elapsed_ms(stage_start)
+
+        # Stage 4: write export (same shape as /api/export)
+        stage_start = time.perf_counter()
+        output_path = _write_export(source, generator_config, results, options['output_dir'],
+                                    options.get('cards', False), options.get('card_workers'))
+        timings['export'] = _elapsed_ms(stage_start)
+
+        summary.update({
+            'success': True,
+            'rows': len(processor.get_data()),
+            'validation': processor.get_validation_report(),
+            'movers': len(movers),
+            'tweets': sum(len(r['tweet_drafts']) for r in results),
+            'movers_summary': movers_summary,
+            'output': output_path
+        })
+    except Exception as e:
+        summary['error'] = f'Pipeline failed: {str(e)}'
+    finally:
+        timings['total'] = _elapsed_ms(started)
+
+    return summary
+
+
+def _write_export(source: str, generator_config: Dict, results: List[Dict], output_dir: str,
+                  cards: bool = False, card_workers: int = None) -> str:
+    """Write results to a timestamped JSON export file (or a zip bundle with share cards)"""
+    os.makedirs(output_dir, exist_ok=True)
+
+    stem = 'stdin' if source == STDIN_SOURCE else os.path.splitext(os.path.basename(source))[0]
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    output_path = os.path.join(output_dir, f'tweets_{stem}_{timestamp}.{"zip" if cards else "json"}')
+
+    export_data = {
+        'generated_at': datetime.now().isoformat(),
+        'source_file': source,
+        'config': generator_config,
+        'results': results
+    }
+    if cards:
+        write_bundle(export_data, output_path,
+                     font_path=config.SHARE_CARD_FONT or None,
+                     logo_path=config.SHARE_CARD_LOGO or None,
+                     template_folder=generator_config['template_folder'],
+                     workers=card_workers)
+        return output_path
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
+
+    return output_path
+
+
+def _elapsed_ms(start: float) -> float:
+    """Milliseconds elapsed since start"""
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+def run_batch(sources: List[str], options: Dict, workers: int = None) -> List[Dict]:
+    """
+    Run the pipeline over many sources using a process pool
+
+    Args:
+        sources: CSV paths (or '-' for stdin)
+        options: Analyzer/generator settings and output folder
+        workers: Max worker processes (defaults to CPU count)
+
+    Returns:
+        List of per-file summaries in input order
+    """
+    stdin_data = sys.stdin.read() if STDIN_SOURCE in sources else None
+
+    # A single file isn't worth the pool startup cost
+    if len(sources) <= 1 or workers == 1:
+        return [run_pipeline(s, options, stdin_data) for s in sources]
+
+    summaries = [None] * len(sources)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(run_pipeline, source, options, stdin_data): index
+            for index, source in enumerate(sources)
+        }
+        for future in as_completed(futures):
+            summaries[futures[future]] = future.result()
+
+    return summaries
+
+
+def print_summary(summaries: List[Dict], wall_ms: float, as_json: bool = False) -> None:
+    """Print per-file results and timing"""
+    if as_json:
+        print(json.dumps({'files': summaries, 'wall_ms': wall_ms}, indent=2, default=str))
+        return
+
+    for s in summaries:
+        t = s['timings']
+        if s['success']:
+            print(f"✓ {s['source']}: {s['rows']} rows, {s['movers']} movers, {s['tweets']} drafts "
+                  f"-> {s['output']}")
+            if s['validation'] and s['validation']['invalid_rows']:
+                checks = ', '.join(f"{name} x{c['count']}" for name, c in s['validation']['checks'].items())
+                print(f"    {s['validation']['invalid_rows']} invalid rows: {checks}")
+            print(f"    process {t['process']}ms | analyze {t['analyze']}ms | "
+                  f"generate {t['generate']}ms | export {t['export']}ms | total {t['total']}ms")
+        else:
+            print(f"✗ {s['source']}: {s.get('error', 'unknown error')} ({t['total']}ms)")
+
+    succeeded = sum(1 for s in summaries if s['success'])
+    print(f"\n{succeeded}/{len(summaries)} files processed in {wall_ms}ms")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build command line argument parser"""
+    parser = argparse.ArgumentParser(
+        description='Generate tweet drafts from NFL futures odds CSVs without the web app'
+    )
+    parser.add_argument('paths', nargs='+',
+                        help="CSV files, directories of CSVs, or '-' to read one CSV from stdin")
+    parser.add_argument('--threshold', type=float, default=config.MOVEMENT_THRESHOLD,
+                        help='Minimum %% change to be considered a mover')
+    parser.add_argument('--top-n', type=int, default=config.TOP_N_MOVERS,
+                        help='How many movers to keep per file')
+    parser.add_argument('--variations', type=int, default=config.TWEET_VARIATIONS,
+                        help='Number of draft versions per mover')
+    parser.add_argument('--output-dir', default=config.EXPORT_FOLDER,
+                        help='Folder for JSON exports')
+    parser.add_argument('--cards', action='store_true',
+                        help='Write a zip bundle with a share-card PNG per mover instead of JSON')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Max worker processes (default: CPU count)')
+    parser.add_argument('--json', action='store_true',
+                        help='Print the run summary as JSON')
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    """CLI entry point"""
+    args = build_parser().parse_args(argv)
+
+    sources = collect_sources(args.paths)
+    if not sources:
+        print('No CSV files found', file=sys.stderr)
+        return 1
+
+    options = {
+        'threshold': args.threshold,
+        'top_n': args.top_n,
+        'variations': args.variations,
+        'output_dir': args.output_dir,
+        'cards': args.cards,
+        # Files already run in parallel; only a single file gets its own card pool
+        'card_workers': (args.workers or config.SHARE_CARD_WORKERS) if len(sources) == 1 else 1
+    }
+
+    started = time.perf_counter()
+    summaries = run_batch(sources, options, args.workers)
+    print_summary(summaries, _elapsed_ms(started), as_json=args.json)
+
+    return 0 if all(s['success'] for s in summaries) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,11 +10,19 @@ load_dotenv()
 # Movement analysis settings
 MOVEMENT_THRESHOLD = 2.0  # Minimum % change to be considered a "mover"
 TOP_N_MOVERS = 10  # How many movers to analyze
+MOVERS_PAGE_SIZE = 100  # Movers per page for /api/movers
 
 # Tweet generation settings
 TWEET_VARIATIONS = 3  # Number of draft versions per mover
 INCLUDE_EMOJIS = True  # Toggle emoji usage
 CHARACTER_LIMIT = 280  # Tweet length limit
+DRAFTS_PER_PAGE = 10  # Movers per page in lazy generation mode
+DRAFT_CACHE_SIZE = 512  # Rendered drafts kept in the LRU
+RESULT_CACHE_SIZE = 2048  # Per-mover results reused when regenerating unchanged movers
+
+# Template files (JSON/YAML families + routing.json), hot reloaded on change
+TEMPLATE_FOLDER = os.getenv('TEMPLATE_FOLDER', 'data/tweet_templates')
+TEMPLATE_RELOAD_INTERVAL = 2.0  # Min seconds between file change checks
 
 # NFL Data Source Priority (for Phase 2)
 NFL_DATA_SOURCES = [
@@ -24,14 +32,71 @@ NFL_DATA_SOURCES = [
     "web_scraping"  # Fallback
 ]
 
+# Context fetching (Phase 2) - sources tried in priority order, "local" is the offline stand-in
+CONTEXT_FETCH_ENABLED = os.getenv('CONTEXT_FETCH_ENABLED', 'True').lower() == 'true'
+CONTEXT_SOURCES = NFL_DATA_SOURCES + ["local"]
+CONTEXT_FILE = os.getenv('CONTEXT_FILE', 'data/contexts.json')
+CONTEXT_CACHE_TTL = int(os.getenv('CONTEXT_CACHE_TTL', 900))  # seconds
+CONTEXT_MAX_CONNECTIONS = 4  # Concurrent requests per source
+CONTEXT_TIMEOUT = 2.0  # Seconds per lookup
+
+# Near-duplicate index of past drafts (persists across weeks)
+DRAFT_INDEX_ENABLED = os.getenv('DRAFT_INDEX_ENABLED', 'True').lower() == 'true'
+DRAFT_INDEX_FILE = os.getenv('DRAFT_INDEX_FILE', 'data/draft_index.jsonl')
+DUPLICATE_THRESHOLD = 0.8  # Estimated similarity flagged as a near-duplicate
+DRAFT_INDEX_MAX_AGE_DAYS = 180
+
+# Request coalescing / backpressure for analyze and generate
+MAX_CONCURRENT_COMPUTATIONS = int(os.getenv('MAX_CONCURRENT_COMPUTATIONS', 4))
+MAX_QUEUED_COMPUTATIONS = int(os.getenv('MAX_QUEUED_COMPUTATIONS', 16))
+COMPUTATION_TIMEOUT = 30.0  # Seconds to wait for a slot or a shared result
+
+# Precompute default analyze/generate results in the background after upload
+WARM_ON_UPLOAD = os.getenv('WARM_ON_UPLOAD', 'True').lower() == 'true'
+WARM_WORKERS = 2  # Background threads per worker process
+
 # File upload settings
 UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER', 'data/uploads')
-ALLOWED_EXTENSIONS = {'csv'}
-MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+ALLOWED_EXTENSIONS = {'csv', 'gz', 'zst', 'zip'}  # CSV, optionally gzip/zstd/zip compressed
+MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB on the wire
+MAX_ROWS = int(os.getenv('MAX_ROWS', 1000000))  # Limit applied to decompressed data rows
+MAX_DECOMPRESSED_SIZE = 500 * 1024 * 1024  # Decompression bomb guard (bytes)
+MAX_DECOMPRESSION_RATIO = 200  # Decompression bomb guard (inflated:compressed)
+
+# Shared board storage (memory-mapped by all workers)
+BOARD_STORE_ENABLED = os.getenv('BOARD_STORE_ENABLED', 'True').lower() == 'true'
+BOARD_STORE_FOLDER = os.getenv('BOARD_STORE_FOLDER', 'data/boards')
+BOARD_STORE_KEEP = 5  # Most recent boards kept on disk
+
+# Live ingestion - feed updates are applied as they arrive and new movers pushed over SSE
+# (state lives in one process: run a single gunicorn worker with threads for live mode)
+LIVE_AUTOSTART = os.getenv('LIVE_AUTOSTART', 'False').lower() == 'true'
+LIVE_WATCH_FOLDER = os.getenv('LIVE_WATCH_FOLDER', 'data/live')  # Each new CSV dropped here is an update
+LIVE_FEED_FILE = os.getenv('LIVE_FEED_FILE', '')  # Optional JSON-lines file tailed as a feed stand-in
+LIVE_POLL_INTERVAL = 0.25  # Seconds between feed polls
+LIVE_QUEUE_SIZE = 256  # Undelivered events kept per subscriber
+LIVE_REPLAY_EVENTS = 500  # Recent events replayed to clients reconnecting with Last-Event-ID
+LIVE_HEARTBEAT = 15.0  # Seconds between SSE keep-alive comments
 
 # Export settings
 EXPORT_FOLDER = os.getenv('EXPORT_FOLDER', 'data/exports')
 
+# Share-card images in export bundles (requires Pillow)
+SHARE_CARD_FONT = os.getenv('SHARE_CARD_FONT', '')  # TrueType font, falls back to system fonts
+SHARE_CARD_LOGO = os.getenv('SHARE_CARD_LOGO', '')  # Optional logo pasted on every card
+SHARE_CARD_WORKERS = int(os.getenv('SHARE_CARD_WORKERS', 0)) or None  # CLI render processes (0 = CPU count)
+
+# Profiling (opt-in) - PROFILING_ENABLED profiles sampled requests, or send the
+# PROFILING_HEADER with PROFILING_TOKEN as its value to profile a single request
+PROFILING_ENABLED = os.getenv('PROFILING_ENABLED', 'False').lower() == 'true'
+PROFILING_STAGES = os.getenv('PROFILING_STAGES', 'False').lower() == 'true'  # Profile stages outside requests (CLI)
+PROFILING_HEADER = 'X-Profile'
+PROFILING_TOKEN = os.getenv('PROFILING_TOKEN', '')
+PROFILE_FOLDER = os.getenv('PROFILE_FOLDER', 'data/profiles')
+PROFILE_SAMPLE_RATE = float(os.getenv('PROFILE_SAMPLE_RATE', 0.05))  # Fraction of requests profiled
+PROFILE_MIN_MS = float(os.getenv('PROFILE_MIN_MS', 0))  # Only keep profiles slower than this
+PROFILE_MAX_FILES = int(os.getenv('PROFILE_MAX_FILES', 50))  # Oldest profiles deleted beyond this
+
 # Flask settings - Use environment variables in production
 FLASK_ENV = os.getenv('FLASK_ENV', 'development')
 DEBUG = os.getenv('DEBUG', 'True').lower() == 'true'
@@ -48,7 +113,29 @@ def get_config():
         'tweet_variations': TWEET_VARIATIONS,
         'include_emojis': INCLUDE_EMOJIS,
         'character_limit': CHARACTER_LIMIT,
+        'template_folder': TEMPLATE_FOLDER,
+        'template_reload_interval': TEMPLATE_RELOAD_INTERVAL,
         'upload_folder': UPLOAD_FOLDER,
-        'allowed_extensions': ALLOWED_EXTENSIONS,
-        'export_folder': EXPORT_FOLDER
+        'allowed_extensions': sorted(ALLOWED_EXTENSIONS),
+        'export_folder': EXPORT_FOLDER,
+        'context_fetch_enabled': CONTEXT_FETCH_ENABLED,
+        'context_sources': CONTEXT_SOURCES,
+        'context_file': CONTEXT_FILE,
+        'context_cache_ttl': CONTEXT_CACHE_TTL,
+        'context_max_connections': CONTEXT_MAX_CONNECTIONS,
+        'context_timeout': CONTEXT_TIMEOUT
+    }
+
+
+def get_profiling_config():
+    """Return profiling settings (kept out of get_config so the token is never exposed)"""
+    return {
+        'profiling_enabled': PROFILING_ENABLED,
+        'profiling_stages': PROFILING_STAGES,
+        'profiling_header': PROFILING_HEADER,
+        'profiling_token': PROFILING_TOKEN,
+        'profile_folder': PROFILE_FOLDER,
+        'profile_sample_rate': PROFILE_SAMPLE_RATE,
+        'profile_min_ms': PROFILE_MIN_MS,
+        'profile_max_files': PROFILE_MAX_FILES
     }
@@ -0,0 +1,382 @@
+"""
+NFL Social Content Generator - Local Load Testing Harness
+Starts the app under gunicorn and drives upload -> analyze -> generate -> export sessions
+
+Usage:
+    python loadtest.py
+    python loadtest.py --configs 1x1 2x4 4x2 --users 16 --duration 30
+    python loadtest.py --url https://my-preview.vercel.app --users 4 --duration 20
+"""
+import argparse
+import json
+import math
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+ENDPOINTS = ['upload', 'analyze', 'generate', 'export']
+MARKETS = [
+    'To Make The Playoffs', 'To Win AFC', 'To Win NFC', 'Super Bowl Winner',
+    'MVP', 'Offensive Player of the Year', 'Defensive Player of the Year'
+]
+READY_TIMEOUT = 30.0  # Seconds to wait for gunicorn to answer
+REQUEST_TIMEOUT = 60.0
+
+
+def synthetic_board(rows: int, seed: int) -> bytes:
+    """
+    Build a random but internally consistent odds board
+
+    Percentages are derived from the American odds so the board passes
+    CSVProcessor validation like a real export would.
+
+    Args:
+        rows: Number of (market, team_player) rows
+        seed: Random seed (same seed, same board)
+
+    Returns:
+        CSV file content
+    """
+    rng = random.Random(seed)
+    lines = ['market,team_player,last_week_pct,this_week_pct,change_pct,last_week_american,this_week_american']
+    for index in range(rows):
+        market = MARKETS[index % len(MARKETS)]
+        last_odds = _random_odds(rng)
+        this_odds = last_odds if rng.random() < 0.5 else _random_odds(rng)
+        last_pct = _implied_pct(last_odds)
+        this_pct = _implied_pct(this_odds)
+        lines.append(
+            f'{market},Team {index:05d},{last_pct:.2f},{this_pct:.2f},{this_pct - last_pct:.2f},'
+            f'{last_odds:+d},{this_odds:+d}'
+        )
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def _random_odds(rng: random.Random) -> int:
+    return rng.choice([-1, 1]) * rng.randint(105, 5000)
+
+
+def _implied_pct(odds: int) -> float:
+    if odds < 0:
+        return -odds / (-odds + 100) * 100
+    return 100 / (odds + 100) * 100
+
+
+# --- HTTP client --------------------------------------------------------------
+
+def _request(url: str, body: bytes = None, content_type: str = 'application/json') -> int:
+    """POST (or GET without body) and return the status code, reading the full response"""
+    req = urllib.request.Request(url, data=body, method='POST' if body is not None else 'GET')
+    if body is not None:
+        req.add_header('Content-Type', content_type)
+    try:
+        with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        e.read()
+        return e.code
+
+
+def _multipart(filename: str, content: bytes) -> Tuple[bytes, str]:
+    """Encode a single file field as multipart/form-data"""
+    boundary = uuid.uuid4().hex
+    body = (
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        f'Content-Type: text/csv\r\n\r\n'
+    ).encode('utf-8') + content + f'\r\n--{boundary}--\r\n'.encode('utf-8')
+    return body, f'multipart/form-data; boundary={boundary}'
+
+
+class SessionRecorder:
+    """Thread-safe latency/status samples per endpoint"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {endpoint: [] for endpoint in ENDPOINTS}
+        self.sessions = 0
+
+    def timed(self, endpoint: str, url: str, body: bytes = None,
+              content_type: str = 'application/json') -> int:
+        started = time.perf_counter()
+        try:
+            status = _request(url, body, content_type)
+        except (urllib.error.URLError, OSError):
+            status = 0  # Connection error / timeout
+        elapsed = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self.samples[endpoint].append((elapsed, status))
+        return status
+
+    def session_done(self) -> None:
+        with self._lock:
+            self.sessions += 1
+
+
+def run_session(base_url: str, board: bytes, recorder: SessionRecorder, options: Dict) -> None:
+    """One editor's upload -> analyze -> generate -> export flow (stops at the first failure)"""
+    body, content_type = _multipart('loadtest_board.csv', board)
+    steps = [
+        ('upload', '/api/upload', body, content_type),
+        ('analyze', '/api/analyze', json.dumps({'threshold': options['threshold']}).encode(), 'application/json'),
+        ('generate', '/api/generate', b'{}', 'application/json'),
+        ('export', '/api/export', b'{}', 'application/json'),
+    ]
+    for endpoint, path, payload, ctype in steps:
+        status = recorder.timed(endpoint, base_url + path, payload, ctype)
+        if status >= 400 or status == 0:
+            return
+        if options['think_ms']:
+            time.sleep(options['think_ms'] / 1000)
+    recorder.session_done()
+
+
+def drive_load(base_url: str, options: Dict) -> Dict:
+    """
+    Run concurrent editor sessions for a fixed duration
+
+    Args:
+        base_url: Server root URL
+        options: users, duration, rows, boards, threshold, think_ms
+
+    Returns:
+        Report dict (see summarize)
+    """
+    boards = [synthetic_board(options['rows'], seed) for seed in range(options['boards'])]
+    recorder = SessionRecorder()
+    deadline = time.perf_counter() + options['duration']
+
+    def user(index: int) -> None:
+        rng = random.Random(index)
+        while time.perf_counter() < deadline:
+            run_session(base_url, rng.choice(boards), recorder, options)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=user, args=(i,), daemon=True) for i in range(options['users'])]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return summarize(recorder, time.perf_counter() - started)
+
+
+# --- reporting ----------------------------------------------------------------
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize(recorder: SessionRecorder, elapsed: float) -> Dict:
+    """Throughput, latency percentiles and error rates per endpoint"""
+    endpoints = {}
+    for endpoint, samples in recorder.samples.items():
+        latencies = sorted(latency for latency, _ in samples)
+        statuses = [status for _, status in samples]
+        errors = sum(1 for s in statuses if s >= 400 or s == 0)
+        status_counts = {}
+        for status in statuses:
+            status_counts[str(status)] = status_counts.get(str(status), 0) + 1
+        endpoints[endpoint] = {
+            'requests': len(samples),
+            'errors': errors,
+            'error_rate': round(errors / len(samples), 4) if samples else 0.0,
+            'throttled': status_counts.get('429', 0),
+            'rps': round(len(samples) / elapsed, 2) if elapsed else 0.0,
+            'p50_ms': round(percentile(latencies, 50), 1),
+            'p95_ms': round(percentile(latencies, 95), 1),
+            'p99_ms': round(percentile(latencies, 99), 1),
+            'max_ms': round(latencies[-1], 1) if latencies else 0.0,
+            'statuses': status_counts
+        }
+
+    total_requests = sum(e['requests'] for e in endpoints.values())
+    total_errors = sum(e['errors'] for e in endpoints.values())
+    return {
+        'elapsed_s': round(elapsed, 2),
+        'sessions': recorder.sessions,
+        'sessions_per_s': round(recorder.sessions / elapsed, 2) if elapsed else 0.0,
+        'requests': total_requests,
+        'rps': round(total_requests / elapsed, 2) if elapsed else 0.0,
+        'error_rate': round(total_errors / total_requests, 4) if total_requests else 0.0,
+        'endpoints': endpoints
+    }
+
+
+def print_report(runs: List[Dict]) -> None:
+    """Print one latency table per server configuration"""
+    for run in runs:
+        print(f"\n== {run['label']} ==")
+        if 'error' in run:
+            print(f"  failed: {run['error']}")
+            continue
+        report = run['report']
+        print(f"  {report['sessions']} sessions ({report['sessions_per_s']}/s), "
+              f"{report['requests']} requests ({report['rps']}/s), "
+              f"error rate {report['error_rate']:.1%} in {report['elapsed_s']}s")
+        print(f"  {'endpoint':<10}{'reqs':>7}{'rps':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{'err%':>8}{'429s':>6}")
+        for endpoint, e in report['endpoints'].items():
+            print(f"  {endpoint:<10}{e['requests']:>7}{e['rps']:>8}{e['p50_ms']:>9}{e['p95_ms']:>9}"
+                  f"{e['p99_ms']:>9}{e['max_ms']:>9}{e['error_rate']:>8.1%}{e['throttled']:>6}")
+            other = {s: c for s, c in e['statuses'].items() if s not in ('200', '429')}
+            if other:
+                print(f"  {'':<10}statuses: {other}")
+
+
+# --- server management --------------------------------------------------------
+
+def parse_server_config(value: str) -> Tuple[int, int]:
+    """Parse 'WORKERSxTHREADS' (e.g. 2x4)"""
+    try:
+        workers, threads = (int(part) for part in value.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'Expected WORKERSxTHREADS, got {value!r}')
+    if workers < 1 or threads < 1:
+        raise argparse.ArgumentTypeError('Workers and threads must be at least 1')
+    return workers, threads
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers: int, threads: int, data_dir: str) -> Tuple[subprocess.Popen, str]:
+    """
+    Start the app under gunicorn with its data folders isolated in data_dir
+
+    Returns:
+        (process, base_url) once the server answers
+    """
+    port = _free_port()
+    env = dict(os.environ, **{
+        'DEBUG': 'False',
+        'UPLOAD_FOLDER': os.path.join(data_dir, 'uploads'),
+        'EXPORT_FOLDER': os.path.join(data_dir, 'exports'),
+        'BOARD_STORE_FOLDER': os.path.join(data_dir, 'boards'),
+        'DRAFT_INDEX_FILE': os.path.join(data_dir, 'draft_index.jsonl'),
+        'PROFILE_FOLDER': os.path.join(data_dir, 'profiles'),
+    })
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '--workers', str(workers), '--threads', str(threads),
+         '--bind', f'127.0.0.1:{port}', '--timeout', '120', '--log-level', 'warning', 'app:app'],
+        cwd=os.path.dirname(os.path.abspath(__file__)), env=env
+    )
+    base_url = f'http://127.0.0.1:{port}'
+
+    deadline = time.perf_counter() + READY_TIMEOUT
+    while time.perf_counter() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'gunicorn exited with code {process.returncode}')
+        try:
+            if _request(base_url + '/api/config') == 200:
+                return process, base_url
+        except (urllib.error.URLError, OSError):
+            pass
+        time.sleep(0.2)
+
+    stop_server(process)
+    raise RuntimeError(f'gunicorn did not become ready within {READY_TIMEOUT:.0f}s')
+
+
+def stop_server(process: subprocess.Popen) -> None:
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def run_config(server_config: Optional[Tuple[int, int]], options: Dict, url: str = None) -> Dict:
+    """Load test one gunicorn configuration (or an already running server at url)"""
+    if url is not None:
+        return {'label': url, 'url': url, 'report': drive_load(url.rstrip('/'), options)}
+
+    workers, threads = server_config
+    label = f'gunicorn {workers} worker(s) x {threads} thread(s)'
+    run = {'label': label, 'workers': workers, 'threads': threads, 'report': None}
+    data_dir = tempfile.mkdtemp(prefix='loadtest-')
+    try:
+        process, base_url = start_server(workers, threads, data_dir)
+        try:
+            run['report'] = drive_load(base_url, options)
+        finally:
+            stop_server(process)
+    except RuntimeError as e:
+        run['error'] = str(e)
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+    return run
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build command line argument parser"""
+    parser = argparse.ArgumentParser(
+        description='Load test the app with concurrent upload/analyze/generate/export sessions'
+    )
+    parser.add_argument('--configs', nargs='+', type=parse_server_config, default=[(1, 1), (2, 4)],
+                        metavar='WxT', help='gunicorn workers x threads to test (default: 1x1 2x4)')
+    parser.add_argument('--url', default=None,
+                        help='Test an already running server (e.g. a Vercel preview) instead of starting gunicorn')
+    parser.add_argument('--users', type=int, default=8,
+                        help='Concurrent editor sessions')
+    parser.add_argument('--duration', type=float, default=20.0,
+                        help='Seconds to run each configuration')
+    parser.add_argument('--rows', type=int, default=500,
+                        help='Rows per synthetic board')
+    parser.add_argument('--boards', type=int, default=4,
+                        help='Distinct synthetic boards to rotate through')
+    parser.add_argument('--threshold', type=float, default=3.0,
+                        help='Movement threshold sent to /api/analyze')
+    parser.add_argument('--think-ms', type=float, default=0.0,
+                        help='Pause between steps of a session')
+    parser.add_argument('--json', action='store_true',
+                        help='Print the reports as JSON')
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    """Load test entry point"""
+    args = build_parser().parse_args(argv)
+
+    options = {
+        'users': args.users,
+        'duration': args.duration,
+        'rows': args.rows,
+        'boards': args.boards,
+        'threshold': args.threshold,
+        'think_ms': args.think_ms
+    }
+
+    if args.url:
+        runs = [run_config(None, options, url=args.url)]
+    else:
+        runs = [run_config(server_config, options) for server_config in args.configs]
+
+    if args.json:
+        print(json.dumps({'options': options, 'runs': runs}, indent=2))
+    else:
+        print_report(runs)
+
+    return 0 if all('error' not in run for run in runs) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,5 +5,9 @@ from .csv_processor import CSVProcessor
 from .movers_analyzer import MoversAnalyzer
 from .tweet_generator import TweetGenerator
 from .templates import TweetTemplates
+from .context_fetcher import ContextFetcher
+from .template_registry import TemplateRegistry
+from .board_store import BoardStore
 
-__all__ = ['CSVProcessor', 'MoversAnalyzer', 'TweetGenerator', 'TweetTemplates']
+__all__ = ['CSVProcessor', 'MoversAnalyzer', 'TweetGenerator', 'TweetTemplates', 'ContextFetcher',
+           'TemplateRegistry', 'BoardStore']
@@ -0,0 +1,251 @@
+"""
+Aggregation Module
+Single-pass board and movers statistics with per-market breakdowns
+"""
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+class SummaryAggregator:
+    """
+    Per-market sufficient statistics for change_pct
+
+    One pass over a frame (one factorize of market plus bincounts) yields
+    counts, sums and min/max for every market; the biggest riser/faller is
+    the earliest row matching its market's max/min, so no rows are sorted.
+    Board-wide numbers are derived from the per-market state, so appending
+    rows with add() only costs time proportional to the new rows.
+
+    Rows can also be taken out again with remove(). Counts and sums are
+    subtracted exactly; min/max and the biggest riser/faller can't be, so a
+    market whose extreme row was removed is marked stale until the caller
+    rebuilds it from that market's rows (rebuild_market).
+
+    Sums are kept as integer millionths of a percent, so adding and removing
+    rows is exact and a patched board summarizes exactly like a fresh one.
+    """
+
+    SUM_SCALE = 10 ** 6
+
+    def __init__(self):
+        self._markets = {}  # market -> stats dict, in order of first appearance
+        self._rows = 0
+        self._next_position = 0
+        self._stale = set()
+
+    @staticmethod
+    def _empty_stats() -> Dict:
+        return {
+            'count': 0, 'sum': 0, 'min': np.inf, 'max': -np.inf,
+            'risers': 0, 'biggest_riser': None, 'biggest_faller': None
+        }
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'SummaryAggregator':
+        """
+        Build aggregator from a board or movers frame
+
+        Args:
+            df: DataFrame with market, team_player and change_pct
+
+        Returns:
+            SummaryAggregator
+        """
+        aggregator = cls()
+        aggregator.add(df)
+        return aggregator
+
+    def add(self, df: pd.DataFrame, positions: np.ndarray = None) -> None:
+        """
+        Fold new rows into the statistics
+
+        Args:
+            df: Rows to append (market, team_player, change_pct)
+            positions: Board row positions of the rows, used to break ties
+                (default: appended after all rows seen so far)
+        """
+        if df.empty:
+            return
+
+        codes, markets = pd.factorize(df['market'], sort=False)
+        change = df['change_pct'].to_numpy(dtype=float)
+        if positions is None:
+            positions = np.arange(self._next_position, self._next_position + len(df))
+        positions = np.asarray(positions)
+        self._next_position = max(self._next_position, int(positions.max()) + 1)
+        k = len(markets)
+
+        counts = np.bincount(codes, minlength=k)
+        # Integer-valued float weights sum exactly while totals stay below 2**53
+        sums = np.rint(np.bincount(codes, weights=np.rint(change * self.SUM_SCALE), minlength=k))
+        mins = np.full(k, np.inf)
+        maxs = np.full(k, -np.inf)
+        np.minimum.at(mins, codes, change)
+        np.maximum.at(maxs, codes, change)
+
+        up = change > 0
+        up_counts = np.bincount(codes[up], minlength=k)
+        best_up = self._first_per_group(codes, up & (change == maxs[codes]), positions)
+        best_down = self._first_per_group(codes, ~up & (change == mins[codes]), positions)
+        # Only the winning rows' names are needed
+        winners = sorted(set(best_up.values()) | set(best_down.values()))
+        players = dict(zip(winners, df['team_player'].iloc[winners].astype(str).tolist()))
+
+        for code, market in enumerate(markets):
+            market = str(market)
+            stats = self._markets.get(market)
+            if stats is None:
+                stats = self._markets[market] = self._empty_stats()
+            stats['count'] += int(counts[code])
+            stats['sum'] += int(sums[code])
+            stats['min'] = min(stats['min'], float(mins[code]))
+            stats['max'] = max(stats['max'], float(maxs[code]))
+            stats['risers'] += int(up_counts[code])
+
+            if code in best_up:
+                row = best_up[code]
+                candidate = (float(change[row]), -int(positions[row]), players[row])
+                if stats['biggest_riser'] is None or candidate[:2] > stats['biggest_riser'][:2]:
+                    stats['biggest_riser'] = candidate
+            if code in best_down:
+                row = best_down[code]
+                candidate = (float(change[row]), int(positions[row]), players[row])
+                if stats['biggest_faller'] is None or candidate[:2] < stats['biggest_faller'][:2]:
+                    stats['biggest_faller'] = candidate
+
+        self._rows += len(df)
+
+    def remove(self, df: pd.DataFrame, positions: np.ndarray) -> None:
+        """
+        Take rows back out of the statistics (e.g. the old values of updated rows)
+
+        Args:
+            df: Rows as they were added (market, team_player, change_pct)
+            positions: Board row positions the rows were added with
+        """
+        markets = df['market'].astype(str).to_numpy()
+        change = df['change_pct'].to_numpy(dtype=float)
+        units = np.rint(change * self.SUM_SCALE).astype(np.int64).tolist()
+        for market, value, unit, position in zip(markets, change.tolist(), units, np.asarray(positions).tolist()):
+            stats = self._markets[market]
+            stats['count'] -= 1
+            stats['sum'] -= unit
+            if value > 0:
+                stats['risers'] -= 1
+            riser, faller = stats['biggest_riser'], stats['biggest_faller']
+            if value in (stats['min'], stats['max']) or \
+                    (riser is not None and -riser[1] == position) or \
+                    (faller is not None and faller[1] == position):
+                self._stale.add(market)
+        self._rows -= len(df)
+
+    def pop_stale(self) -> List[str]:
+        """Markets whose extremes need rebuild_market (clears the list)"""
+        stale, self._stale = sorted(self._stale), set()
+        return stale
+
+    def rebuild_market(self, market: str, df: pd.DataFrame, positions: np.ndarray) -> None:
+        """
+        Recompute one market from all of its current rows
+
+        Args:
+            market: Market name
+            df: Every row of the market (market, team_player, change_pct)
+            positions: Board row positions of those rows
+        """
+        stats = self._markets[market]
+        self._rows -= stats['count']
+        stats.update(self._empty_stats())  # Keeps the market's place in the ordering
+        self.add(df, positions)
+        self._stale.discard(market)
+
+    @staticmethod
+    def _first_per_group(codes: np.ndarray, mask: np.ndarray, positions: np.ndarray) -> Dict[int, int]:
+        """Masked row with the lowest position per group (only the few masked rows are sorted)"""
+        rows = np.flatnonzero(mask)
+        rows = rows[np.lexsort((positions[rows], codes[rows]))]
+        group_codes, first = np.unique(codes[rows], return_index=True)
+        return dict(zip(group_codes.tolist(), rows[first].tolist()))
+
+    @property
+    def total_rows(self) -> int:
+        return self._rows
+
+    def markets(self) -> List[str]:
+        """Markets in order of first appearance"""
+        return list(self._markets)
+
+    def _totals(self) -> Dict:
+        stats = self._markets.values()
+        return {
+            'count': sum(s['count'] for s in stats),
+            'sum': sum(s['sum'] for s in stats),
+            'min': min((s['min'] for s in stats), default=np.nan),
+            'max': max((s['max'] for s in stats), default=np.nan),
+            'risers': sum(s['risers'] for s in stats)
+        }
+
+    def _mean(self, total: int, count: int) -> float:
+        return total / self.SUM_SCALE / count if count else np.nan
+
+    def _overall_best(self, key: str, pick) -> Dict:
+        """Biggest riser/faller across markets, formatted like MoversAnalyzer"""
+        candidates = [
+            (s[key], market) for market, s in self._markets.items() if s[key] is not None
+        ]
+        if not candidates:
+            return {}
+        (change, _, team_player), market = pick(candidates, key=lambda c: c[0][:2])
+        return {
+            'market': market,
+            'team_player': team_player,
+            'change_pct': round(change, 2)
+        }
+
+    def board_summary(self) -> Dict:
+        """Summary in the shape of CSVProcessor.get_summary"""
+        totals = self._totals()
+        mean = self._mean(totals['sum'], totals['count'])
+        return {
+            'total_rows': self._rows,
+            'markets': self.markets(),
+            'market_counts': dict(sorted(
+                ((m, s['count']) for m, s in self._markets.items()),
+                key=lambda item: item[1], reverse=True
+            )),
+            'avg_change': round(mean, 2),
+            'max_change': round(totals['max'], 2),
+            'min_change': round(totals['min'], 2)
+        }
+
+    def movers_summary(self) -> Dict:
+        """Summary in the shape of MoversAnalyzer.get_movers_summary"""
+        totals = self._totals()
+        mean = self._mean(totals['sum'], totals['count'])
+        return {
+            'total_movers': self._rows,
+            'risers_count': totals['risers'],
+            'fallers_count': totals['count'] - totals['risers'],
+            'avg_change': round(mean, 2),
+            'biggest_riser': self._overall_best('biggest_riser', max),
+            'biggest_faller': self._overall_best('biggest_faller', min),
+            'markets_affected': self.markets()
+        }
+
+    def market_breakdown(self) -> Dict[str, Dict]:
+        """Per-market statistics"""
+        breakdown = {}
+        for market, s in self._markets.items():
+            breakdown[market] = {
+                'count': s['count'],
+                'risers': s['risers'],
+                'fallers': s['count'] - s['risers'],
+                'avg_change': round(self._mean(s['sum'], s['count']), 2),
+                'max_change': round(s['max'], 2),
+                'min_change': round(s['min'], 2),
+                'biggest_riser': s['biggest_riser'][2] if s['biggest_riser'] else None,
+                'biggest_faller': s['biggest_faller'][2] if s['biggest_faller'] else None
+            }
+        return breakdown
@@ -0,0 +1,185 @@
+"""
+Board Store Module
+Writes cleaned boards once as columnar NumPy files that every worker memory-maps read-only
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class BoardStore:
+    """
+    Columnar on-disk storage for cleaned odds boards
+
+    Each board is a folder of one .npy file per numeric column plus
+    dictionary-encoded string columns (int codes .npy + categories in
+    meta.json). Opening a board memory-maps the arrays read-only, so every
+    gunicorn worker shares the same page cache instead of holding its own copy.
+    """
+
+    META_FILE = 'meta.json'
+    CURRENT_FILE = 'CURRENT'
+
+    def __init__(self, folder: str, keep: int = 5):
+        """
+        Initialize store
+
+        Args:
+            folder: Root folder for stored boards
+            keep: Number of most recent boards to retain
+        """
+        self.folder = folder
+        self.keep = keep
+        os.makedirs(folder, exist_ok=True)
+
+    @staticmethod
+    def fingerprint(df: pd.DataFrame) -> str:
+        """
+        Content fingerprint of a board (stable across workers)
+
+        Args:
+            df: Cleaned board DataFrame
+
+        Returns:
+            Hex digest identifying the board contents
+        """
+        digest = hashlib.sha1()
+        digest.update(','.join(map(str, df.columns)).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+        return digest.hexdigest()[:16]
+
+    def write(self, df: pd.DataFrame, filename: str = None, board_id: str = None) -> str:
+        """
+        Write a cleaned board and mark it as current
+
+        Args:
+            df: Cleaned board DataFrame (output of CSVProcessor.process)
+            filename: Original upload name, stored for reference
+            board_id: Id to store under (default: content fingerprint)
+
+        Returns:
+            Board id
+        """
+        board_id = board_id or self.fingerprint(df)
+        board_path = os.path.join(self.folder, board_id)
+
+        if not os.path.isdir(board_path):
+            # Build in a temp folder then rename, so readers never see a partial board
+            tmp_path = tempfile.mkdtemp(dir=self.folder, prefix='.tmp-')
+            try:
+                self._write_columns(df.reset_index(drop=True), tmp_path, filename)
+                os.rename(tmp_path, board_path)
+            except OSError:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+                if not os.path.isdir(board_path):
+                    raise
+
+        self._set_current(board_id)
+        self._prune()
+        return board_id
+
+    def _write_columns(self, df: pd.DataFrame, path: str, filename: Optional[str]) -> None:
+        """Write each column as its own .npy file"""
+        columns = []
+        for index, col in enumerate(df.columns):
+            series = df[col]
+            entry = {'name': col, 'file': f'col{index}.npy'}
+            if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                values = series.to_numpy(dtype=np.float64 if series.hasnans else None)
+                entry['kind'] = 'numeric'
+            else:
+                codes, categories = pd.factorize(series.astype('string'), use_na_sentinel=True)
+                values = codes.astype(np.int32)
+                entry['kind'] = 'category'
+                entry['categories'] = [str(c) for c in categories]
+            np.save(os.path.join(path, entry['file']), np.ascontiguousarray(values))
+            columns.append(entry)
+
+        meta = {'rows': len(df), 'columns': columns, 'source_file': filename}
+        with open(os.path.join(path, self.META_FILE), 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+    def open(self, board_id: str) -> pd.DataFrame:
+        """
+        Open a stored board as a read-only DataFrame backed by memory maps
+
+        Numeric columns share memory with the mapped files. String columns
+        are returned as categoricals built from the mapped codes.
+
+        Args:
+            board_id: Board id returned by write()
+
+        Returns:
+            DataFrame view over the stored board
+        """
+        board_path = os.path.join(self.folder, board_id)
+        with open(os.path.join(board_path, self.META_FILE), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+
+        data = {}
+        for entry in meta['columns']:
+            values = np.load(os.path.join(board_path, entry['file']), mmap_mode='r')
+            if entry['kind'] == 'numeric':
+                data[entry['name']] = values
+            else:
+                data[entry['name']] = pd.Categorical.from_codes(values, categories=entry['categories'])
+
+        df = pd.DataFrame(data, copy=False)
+        df.attrs['board_id'] = board_id
+        df.attrs['source_file'] = meta.get('source_file')
+        return df
+
+    def open_current(self) -> Optional[pd.DataFrame]:
+        """
+        Open the most recently written board, if any
+
+        Lets a worker that didn't handle the upload pick up the shared board.
+
+        Returns:
+            DataFrame view or None
+        """
+        board_id = self.current_id()
+        if board_id is None:
+            return None
+        try:
+            return self.open(board_id)
+        except (OSError, ValueError):
+            return None
+
+    def current_id(self) -> Optional[str]:
+        """Get id of the current board"""
+        try:
+            with open(os.path.join(self.folder, self.CURRENT_FILE), 'r', encoding='utf-8') as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def _set_current(self, board_id: str) -> None:
+        """Atomically point CURRENT at a board"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.folder, prefix='.current-')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(board_id)
+        os.replace(tmp_path, os.path.join(self.folder, self.CURRENT_FILE))
+        # Touch the board so pruning keeps recently used boards
+        os.utime(os.path.join(self.folder, board_id))
+
+    def list_boards(self) -> List[str]:
+        """List stored board ids, newest first"""
+        boards = [
+            name for name in os.listdir(self.folder)
+            if not name.startswith('.') and os.path.isdir(os.path.join(self.folder, name))
+        ]
+        return sorted(boards, key=lambda b: os.path.getmtime(os.path.join(self.folder, b)), reverse=True)
+
+    def _prune(self) -> None:
+        """Delete boards beyond the retention limit (never the current one)"""
+        current = self.current_id()
+        for board_id in self.list_boards()[self.keep:]:
+            if board_id != current:
+                shutil.rmtree(os.path.join(self.folder, board_id), ignore_errors=True)
@@ -0,0 +1,157 @@
+"""
+Compressed Upload Module
+Streams gzip/zstd/zip-wrapped CSVs into CSVProcessor with decompression bomb protection
+"""
+import gzip
+import io
+import zipfile
+import zlib
+from typing import BinaryIO, Optional
+
+try:
+    import zstandard
+except ImportError:  # zstd uploads are optional
+    zstandard = None
+
+
+# Magic bytes for supported formats
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+ZIP_MAGIC = b'PK\x03\x04'
+
+
+class DecompressionLimitError(ValueError):
+    """Raised when decompressed output exceeds the configured limits"""
+
+
+class _CountingReader(io.RawIOBase):
+    """Raw stream wrapper that counts bytes read"""
+
+    def __init__(self, raw: BinaryIO):
+        self.raw = raw
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.raw.read(len(buffer))
+        n = len(data)
+        buffer[:n] = data
+        self.bytes_read += n
+        return n
+
+
+class _LimitedReader(io.RawIOBase):
+    """Raw stream wrapper that stops decompression bombs"""
+
+    def __init__(self, raw: BinaryIO, compressed: _CountingReader, max_bytes: int, max_ratio: float):
+        self.raw = raw
+        self.compressed = compressed
+        self.max_bytes = max_bytes
+        self.max_ratio = max_ratio
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        try:
+            data = self.raw.read(len(buffer))
+        except (zipfile.BadZipFile, zlib.error) as e:
+            # Corrupt data (bad CRC, broken deflate stream) only shows up while reading
+            raise ValueError(f'Corrupt compressed upload: {e}') from e
+        n = len(data)
+        buffer[:n] = data
+        self.bytes_read += n
+
+        if self.bytes_read > self.max_bytes:
+            raise DecompressionLimitError(
+                f'Decompressed size exceeds {self.max_bytes // (1024 * 1024)}MB limit'
+            )
+        # Ratio is only meaningful once a reasonable amount has been inflated
+        if self.bytes_read > 1024 * 1024 and self.compressed.bytes_read:
+            ratio = self.bytes_read / self.compressed.bytes_read
+            if ratio > self.max_ratio:
+                raise DecompressionLimitError(
+                    f'Compression ratio {ratio:.0f}:1 exceeds {self.max_ratio:.0f}:1 limit'
+                )
+        return n
+
+
+def detect_compression(stream: BinaryIO, filename: str = '') -> Optional[str]:
+    """
+    Detect compression from magic bytes, falling back to the file extension
+
+    Args:
+        stream: Seekable or peekable binary stream (position is restored)
+        filename: Original file name
+
+    Returns:
+        'gzip', 'zstd', 'zip' or None for plain CSV
+    """
+    if hasattr(stream, 'peek'):
+        head = stream.peek(4)[:4]
+    else:
+        position = stream.tell()
+        head = stream.read(4)
+        stream.seek(position)
+
+    if head.startswith(GZIP_MAGIC):
+        return 'gzip'
+    if head.startswith(ZSTD_MAGIC):
+        return 'zstd'
+    if head.startswith(ZIP_MAGIC):
+        return 'zip'
+
+    extension = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    return {'gz': 'gzip', 'zst': 'zstd', 'zip': 'zip'}.get(extension)
+
+
+def open_csv_stream(stream: BinaryIO, filename: str = '', max_bytes: int = 200 * 1024 * 1024,
+                    max_ratio: float = 200.0) -> BinaryIO:
+    """
+    Wrap an upload stream so reads return decompressed CSV bytes
+
+    Nothing is written to disk; the CSV is inflated as pandas reads it.
+
+    Args:
+        stream: Binary upload stream
+        filename: Original file name (used when magic bytes are inconclusive)
+        max_bytes: Max decompressed bytes allowed
+        max_ratio: Max decompressed/compressed ratio allowed
+
+    Returns:
+        Binary file-like object yielding CSV bytes
+
+    Raises:
+        ValueError: Unsupported or invalid archive
+    """
+    compression = detect_compression(stream, filename)
+    if compression is None:
+        return stream
+
+    compressed = _CountingReader(stream)
+
+    if compression == 'gzip':
+        decompressed = gzip.GzipFile(fileobj=compressed, mode='rb')
+    elif compression == 'zstd':
+        if zstandard is None:
+            raise ValueError('zstd uploads require the zstandard package')
+        decompressed = zstandard.ZstdDecompressor().stream_reader(compressed)
+    else:
+        # zip needs random access to its central directory; uploads are spooled so seeking is fine
+        try:
+            archive = zipfile.ZipFile(stream)
+            members = [m for m in archive.infolist() if not m.is_dir() and m.filename.lower().endswith('.csv')]
+            if len(members) != 1:
+                raise ValueError('Zip uploads must contain exactly one .csv file')
+            decompressed = archive.open(members[0])
+        except (zipfile.BadZipFile, zipfile.LargeZipFile) as e:
+            raise ValueError(f'Invalid zip upload: {e}') from e
+        # The zip reader reads the member itself, so count its compressed size up front
+        # (capped at the real upload size, since header sizes are attacker controlled)
+        stream.seek(0, io.SEEK_END)
+        compressed.bytes_read = max(min(members[0].compress_size, stream.tell()), 1)
+
+    return io.BufferedReader(_LimitedReader(decompressed, compressed, max_bytes, max_ratio))
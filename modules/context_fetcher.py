@@ -0,0 +1,240 @@
+"""
+Context Fetcher Module
+Fetches NFL context for movers from pluggable data sources (Phase 2)
+"""
+import asyncio
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class ContextSource:
+    """Base class for a context data source"""
+
+    name = 'base'
+
+    def __init__(self, max_connections: int = 4, timeout: float = 2.0):
+        """
+        Initialize source
+
+        Args:
+            max_connections: Max concurrent requests to this source
+            timeout: Seconds to wait for a single lookup
+        """
+        self.max_connections = max_connections
+        self.timeout = timeout
+
+    def limiter(self) -> asyncio.Semaphore:
+        """
+        Connection limit for one batch
+
+        Sources are shared by every request thread and each fetch_batch runs
+        its own event loop, so the limit is created per run rather than
+        stored on the source.
+        """
+        return asyncio.Semaphore(self.max_connections)
+
+    async def fetch(self, mover: Dict) -> Optional[str]:
+        """
+        Look up context for a mover
+
+        Args:
+            mover: Mover dictionary (market, team_player, direction, ...)
+
+        Returns:
+            Context string, or None if the source has nothing
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Release resources opened during a batch (must not touch state other batches use)"""
+
+
+class LocalContextSource(ContextSource):
+    """
+    Offline stand-in source backed by a JSON file
+
+    The file maps "team_player" or "market|team_player" keys to context strings.
+    """
+
+    name = 'local'
+
+    def __init__(self, path: str = None, contexts: Dict = None, **kwargs):
+        """
+        Initialize local source
+
+        Args:
+            path: Path to JSON context file
+            contexts: In-memory contexts (used instead of a file)
+        """
+        super().__init__(**kwargs)
+        self.path = path
+        self._contexts = contexts
+        self._loaded_mtime = None
+
+    def _load(self) -> Dict:
+        """Load (or reload on change) the context file"""
+        if self.path is None or not os.path.exists(self.path):
+            return self._contexts or {}
+
+        mtime = os.path.getmtime(self.path)
+        if self._contexts is None or mtime != self._loaded_mtime:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._contexts = json.load(f)
+            self._loaded_mtime = mtime
+        return self._contexts
+
+    async def fetch(self, mover: Dict) -> Optional[str]:
+        contexts = self._load()
+        key = f"{mover['market']}|{mover['team_player']}"
+        return contexts.get(key) or contexts.get(mover['team_player'])
+
+
+# Registered source implementations, keyed by config.NFL_DATA_SOURCES names
+SOURCE_REGISTRY = {
+    'local': LocalContextSource,
+}
+
+
+class ContextFetcher:
+    """Fetch contexts for a batch of movers concurrently with fallback and caching"""
+
+    def __init__(self, sources: List[ContextSource], cache_ttl: float = 900):
+        """
+        Initialize fetcher
+
+        Args:
+            sources: Sources in priority order (first hit wins)
+            cache_ttl: Seconds to keep fetched contexts
+        """
+        self.sources = sources
+        self.cache_ttl = cache_ttl
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'ContextFetcher':
+        """
+        Build fetcher from configuration
+
+        Unknown source names are skipped so the priority list can name
+        sources before they are implemented.
+
+        Args:
+            config: Configuration dictionary
+
+        Returns:
+            ContextFetcher instance
+        """
+        sources = []
+        for name in config.get('context_sources', []):
+            source_cls = SOURCE_REGISTRY.get(name)
+            if source_cls is None:
+                continue
+            kwargs = {
+                'max_connections': config.get('context_max_connections', 4),
+                'timeout': config.get('context_timeout', 2.0)
+            }
+            if source_cls is LocalContextSource:
+                kwargs['path'] = config.get('context_file')
+            sources.append(source_cls(**kwargs))
+        return cls(sources, cache_ttl=config.get('context_cache_ttl', 900))
+
+    def _cache_key(self, mover: Dict) -> tuple:
+        return (mover['market'], mover['team_player'], mover.get('direction'))
+
+    def _cache_get(self, key: tuple) -> Optional[str]:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._cache[key]
+                return None
+            return value
+
+    def _cache_set(self, key: tuple, value: str) -> None:
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + self.cache_ttl, value)
+
+    async def _fetch_from_source(self, source: ContextSource, mover: Dict,
+                                 limiter: asyncio.Semaphore) -> Optional[str]:
+        """Fetch from one source, treating errors and timeouts as a miss"""
+        try:
+            async with limiter:
+                return await asyncio.wait_for(source.fetch(mover), timeout=source.timeout)
+        except Exception:
+            return None
+
+    async def fetch_one(self, mover: Dict, limiters: Dict = None) -> Optional[str]:
+        """
+        Fetch context for one mover, falling back through sources in order
+
+        Args:
+            mover: Mover dictionary
+            limiters: Per-source semaphores of the running batch (created if not given)
+
+        Returns:
+            Context string, or None if no source had one
+        """
+        key = self._cache_key(mover)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        if limiters is None:
+            limiters = {source: source.limiter() for source in self.sources}
+        for source in self.sources:
+            context = await self._fetch_from_source(source, mover, limiters[source])
+            if context:
+                self._cache_set(key, context)
+                return context
+        return None
+
+    async def fetch_batch_async(self, movers: List[Dict]) -> Dict[str, str]:
+        """
+        Fetch contexts for all movers concurrently
+
+        Args:
+            movers: List of mover dictionaries
+
+        Returns:
+            Dict mapping team_player -> context (movers with no hit are omitted)
+        """
+        limiters = {source: source.limiter() for source in self.sources}
+        contexts = await asyncio.gather(*(self.fetch_one(m, limiters) for m in movers))
+        return {
+            mover['team_player']: context
+            for mover, context in zip(movers, contexts)
+            if context
+        }
+
+    def fetch_batch(self, movers: List[Dict]) -> Dict[str, str]:
+        """
+        Synchronous wrapper around fetch_batch_async for Flask/CLI callers
+
+        Args:
+            movers: List of mover dictionaries
+
+        Returns:
+            Dict mapping team_player -> context
+        """
+        if not movers or not self.sources:
+            return {}
+
+        async def _run():
+            try:
+                return await self.fetch_batch_async(movers)
+            finally:
+                for source in self.sources:
+                    await source.close()
+
+        return asyncio.run(_run())
+
+    def clear_cache(self) -> None:
+        """Drop all cached contexts"""
+        with self._cache_lock:
+            self._cache.clear()
@@ -2,9 +2,15 @@
 CSV Processor Module
 Handles importing, validating, and parsing NFL futures odds CSV data
 """
+import io
+
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional
 
+from .profiling import profile_stage
+from .aggregation import SummaryAggregator
+
 
 class CSVProcessor:
     """Process and validate NFL futures odds CSV files"""
@@ -40,31 +46,68 @@ class CSVProcessor:
         'this_week_american'
     ]
 
-    def __init__(self, file_path: str = None, file_object=None):
+    NUMERIC_COLUMNS = [
+        'last_week_pct',
+        'this_week_pct',
+        'change_pct',
+        'last_week_american',
+        'this_week_american'
+    ]
+
+    # Row validation tolerances
+    CHANGE_TOLERANCE = 0.05  # change_pct vs this_week_pct - last_week_pct (pct points)
+    ODDS_TOLERANCE = 1.0  # American odds implied % vs stated % (pct points, allows for vig/rounding)
+    MAX_REPORTED_ROWS = 20  # Row indices listed per check in the report
+
+    CHUNK_ROWS = 50000  # Rows read per chunk when a row limit is enforced
+
+    def __init__(self, file_path: str = None, file_object=None, validate_rows: bool = True,
+                 max_rows: int = None):
         """
         Initialize processor with CSV file path or file object
 
         Args:
             file_path: Path to CSV file (for local files)
             file_object: File-like object (for uploads in serverless environments)
+            validate_rows: Build a row-level validation report while cleaning
+            max_rows: Reject files with more data rows than this (None for no limit)
         """
         self.file_path = file_path
         self.file_object = file_object
+        self.validate_rows = validate_rows
+        self.max_rows = max_rows
         self.df = None
         self.validation_errors = []
+        self.validation_report = None
+        self._parse_failures = {}
 
     def load_csv(self) -> bool:
         """Load CSV file into dataframe from path or file object"""
         try:
             if self.file_object is not None:
                 # Process from file object (uploaded file)
-                self.df = pd.read_csv(self.file_object)
+                source = self.file_object
             elif self.file_path is not None:
                 # Process from file path (local file)
-                self.df = pd.read_csv(self.file_path)
+                source = self.file_path
             else:
                 self.validation_errors.append("No file path or file object provided")
                 return False
+
+            if self.max_rows is None:
+                self.df = pd.read_csv(source)
+                return True
+
+            # Read in chunks so oversized files stop early instead of loading fully
+            chunks = []
+            total_rows = 0
+            for chunk in pd.read_csv(source, chunksize=self.CHUNK_ROWS):
+                total_rows += len(chunk)
+                if total_rows > self.max_rows:
+                    self.validation_errors.append(f"File exceeds the {self.max_rows:,} row limit")
+                    return False
+                chunks.append(chunk)
+            self.df = pd.concat(chunks, ignore_index=True) if chunks else pd.read_csv(io.StringIO(''))
             return True
         except Exception as e:
             self.validation_errors.append(f"Failed to load CSV: {str(e)}")
@@ -115,16 +158,20 @@ class CSVProcessor:
         for col in pct_columns:
             if col in self.df.columns:
                 # Remove % sign and convert to numeric
+                original = self.df[col]
                 self.df[col] = self.df[col].astype(str).str.replace('%', '').str.replace('+', '')
                 self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
+                self._parse_failures[col] = self.df[col].isna() & original.notna()
 
         # Convert American odds to int
         american_columns = ['last_week_american', 'this_week_american']
         for col in american_columns:
             if col in self.df.columns:
                 # Remove + sign if present
+                original = self.df[col]
                 self.df[col] = self.df[col].astype(str).str.replace('+', '')
                 self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
+                self._parse_failures[col] = self.df[col].isna() & original.notna()
 
         # Strip whitespace from string columns and clean team names
         if 'market' in self.df.columns:
@@ -136,9 +183,75 @@ class CSVProcessor:
             self.df['team_player'] = self.df['team_player'].str.replace(r'\s+TO_MAKE_THE_PLAYOFFS$', '', regex=True)
             self.df['team_player'] = self.df['team_player'].str.replace(r'\s+MVP$', '', regex=True)
 
+        # Report bad rows before they are dropped
+        if self.validate_rows:
+            self.validation_report = self.build_validation_report()
+
         # Handle missing values
         self.df = self.df.dropna(subset=['market', 'team_player', 'change_pct'])
 
+    def build_validation_report(self) -> Dict:
+        """
+        Check every row in one vectorized pass
+
+        Checks numeric parse failures, change_pct consistency with the weekly
+        percentages, American odds agreement with the stated implied
+        percentages, duplicate (market, team_player) keys and rows that will
+        be dropped for missing required values.
+
+        Returns:
+            Report dictionary with counts and row indices per check
+        """
+        df = self.df
+        checks = {}
+
+        for col, mask in self._parse_failures.items():
+            checks[f'unparseable_{col}'] = mask
+
+        checks['missing_required'] = df[['market', 'team_player', 'change_pct']].isna().any(axis=1)
+
+        # change_pct should equal this week minus last week
+        expected_change = df['this_week_pct'] - df['last_week_pct']
+        checks['change_mismatch'] = (df['change_pct'] - expected_change).abs() > self.CHANGE_TOLERANCE
+
+        # American odds should agree with the stated implied probability
+        for american_col, pct_col in (('last_week_american', 'last_week_pct'),
+                                      ('this_week_american', 'this_week_pct')):
+            implied = self._implied_pct(df[american_col])
+            checks[f'odds_mismatch_{american_col}'] = (implied - df[pct_col]).abs() > self.ODDS_TOLERANCE
+
+        checks['duplicate_key'] = df.duplicated(subset=['market', 'team_player'], keep=False) & \
+            df['market'].notna() & df['team_player'].notna()
+
+        report = {'rows_checked': len(df), 'invalid_rows': 0, 'checks': {}}
+        any_invalid = np.zeros(len(df), dtype=bool)
+        for name, mask in checks.items():
+            mask = mask.fillna(False).to_numpy(dtype=bool)
+            count = int(mask.sum())
+            if count == 0:
+                continue
+            any_invalid |= mask
+            report['checks'][name] = {
+                'count': count,
+                'rows': df.index[mask][:self.MAX_REPORTED_ROWS].tolist()
+            }
+        report['invalid_rows'] = int(any_invalid.sum())
+        return report
+
+    @staticmethod
+    def _implied_pct(american: pd.Series) -> pd.Series:
+        """Convert American odds to implied probability (%)"""
+        odds = american.astype(float)
+        favorite = odds < 0
+        return pd.Series(
+            np.where(favorite, -odds / (-odds + 100), 100 / (odds + 100)) * 100,
+            index=american.index
+        ).where(odds.notna() & (odds != 0))
+
+    def get_validation_report(self) -> Optional[Dict]:
+        """Get row-level validation report (None until processed)"""
+        return self.validation_report
+
     def get_data(self) -> Optional[pd.DataFrame]:
         """Get processed dataframe"""
         return self.df
@@ -147,6 +260,7 @@ class CSVProcessor:
         """Get validation errors"""
         return self.validation_errors
 
+    @profile_stage('process')
     def process(self) -> bool:
         """Run full processing pipeline"""
         if not self.load_csv():
@@ -166,11 +280,8 @@ class CSVProcessor:
         if self.df is None:
             return {}
 
-        return {
-            'total_rows': len(self.df),
-            'markets': self.df['market'].unique().tolist(),
-            'market_counts': self.df['market'].value_counts().to_dict(),
-            'avg_change': round(self.df['change_pct'].mean(), 2),
-            'max_change': round(self.df['change_pct'].max(), 2),
-            'min_change': round(self.df['change_pct'].min(), 2)
-        }
+        # All stats come from one grouped pass
+        aggregator = SummaryAggregator.from_frame(self.df)
+        summary = aggregator.board_summary()
+        summary['by_market'] = aggregator.market_breakdown()
+        return summary
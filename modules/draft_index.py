@@ -0,0 +1,398 @@
+"""
+Draft Index Module
+Persistent MinHash/LSH index of past drafts for near-duplicate detection and variation rotation
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+class DraftIndex:
+    """
+    Near-duplicate index over previously exported drafts
+
+    Only exported copy is recorded: that is what gets posted, and drafts a
+    board merely generated would otherwise flag the board's own regenerated
+    (or delta-patched) copy.
+
+    Each draft is normalized (lowercased, digits collapsed so new odds don't
+    hide reused copy), split into character shingles and summarized by a
+    MinHash signature. Signatures are split into LSH bands; a lookup only
+    compares against drafts sharing a band bucket, so checks stay sub-linear
+    in the size of the history.
+
+    Drafts are tagged with the board (source) they came from so regenerating
+    the same board never matches itself.
+
+    The file is an append-only JSON-lines log: recording appends only the
+    new or changed entries, and other workers pick them up by reading from
+    their last offset. Once the log holds mostly superseded lines it is
+    compacted on a background thread.
+    """
+
+    PRIME = (1 << 31) - 1
+    SHINGLE_SIZE = 5
+
+    def __init__(self, path: str = None, num_perm: int = 64, bands: int = 16,
+                 threshold: float = 0.8, max_age_days: int = 180, max_entries: int = 20000):
+        """
+        Initialize index
+
+        Args:
+            path: JSON-lines log the index persists to (None keeps it in memory)
+            num_perm: MinHash signature length (must be divisible by bands)
+            bands: Number of LSH bands
+            threshold: Estimated Jaccard similarity reported as a near-duplicate
+            max_age_days: Drop entries older than this
+            max_entries: Keep at most this many entries (newest first)
+        """
+        if num_perm % bands:
+            raise ValueError('num_perm must be divisible by bands')
+
+        self.path = path
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.max_age_days = max_age_days
+        self.max_entries = max_entries
+
+        rng = np.random.RandomState(1)
+        self._a = rng.randint(1, self.PRIME, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, self.PRIME, size=num_perm).astype(np.uint64)
+
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # Appends vs compaction
+        self._entries = {}
+        self._buckets = {}
+        self._exports = {}  # (market, team_player) -> ids of exported entries
+        self._log_inode = None
+        self._log_offset = 0
+        self._log_lines = 0
+        self._compacting = None
+        self.load()
+
+    # --- signatures -----------------------------------------------------
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Lowercase, collapse digits and whitespace"""
+        text = re.sub(r'[+-]?\d+(?:\.\d+)?', '0', text.lower())
+        return re.sub(r'\s+', ' ', text).strip()
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        MinHash signature of a draft
+
+        Args:
+            text: Draft content
+
+        Returns:
+            uint64 array of length num_perm
+        """
+        text = self.normalize(text)
+        size = self.SHINGLE_SIZE
+        shingles = {text[i:i + size] for i in range(max(len(text) - size + 1, 1))}
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=4).digest(), 'little') % self.PRIME
+             for s in shingles),
+            dtype=np.uint64, count=len(shingles)
+        )
+        return ((self._a[:, None] * hashes[None, :] + self._b[:, None]) % self.PRIME).min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> List[str]:
+        return [
+            f'{band}:' + hashlib.blake2b(signature[band * self.rows:(band + 1) * self.rows].tobytes(),
+                                         digest_size=8).hexdigest()
+            for band in range(self.bands)
+        ]
+
+    # --- lookups --------------------------------------------------------
+
+    def query(self, text: str, exclude_source: str = None) -> Optional[Dict]:
+        """
+        Find the most similar exported draft above the threshold
+
+        Args:
+            text: Draft content
+            exclude_source: Ignore drafts recorded from this board
+
+        Returns:
+            Match info (similarity, market, team_player, version, kind, recorded_at) or None
+        """
+        signature = self.signature(text)
+        best = None
+        best_similarity = self.threshold
+
+        with self._lock:
+            candidates = set()
+            for key in self._band_keys(signature):
+                candidates.update(self._buckets.get(key, ()))
+
+            for entry_id in candidates:
+                entry = self._entries.get(entry_id)
+                if entry is None or (exclude_source is not None and entry['source'] == exclude_source):
+                    continue
+                similarity = float(np.mean(entry['signature'] == signature))
+                if similarity >= best_similarity:
+                    best, best_similarity = entry, similarity
+
+        if best is None:
+            return None
+        return {
+            'similarity': round(best_similarity, 2),
+            'market': best['market'],
+            'team_player': best['team_player'],
+            'version': best['version'],
+            'kind': best['kind'],
+            'recorded_at': best['recorded_at']
+        }
+
+    def last_used(self, market: str, team_player: str, exclude_source: str = None) -> Dict[str, float]:
+        """
+        When each template version was last exported for a team/market
+
+        Args:
+            market: Market name
+            team_player: Team or player name
+            exclude_source: Ignore exports of this board
+
+        Returns:
+            Dict mapping version name -> unix timestamp
+        """
+        used = {}
+        with self._lock:
+            for entry_id in self._exports.get((market, team_player), ()):
+                entry = self._entries[entry_id]
+                if exclude_source is not None and entry['source'] == exclude_source:
+                    continue
+                used[entry['version']] = max(used.get(entry['version'], 0), entry['recorded_at'])
+        return used
+
+    # --- recording ------------------------------------------------------
+
+    def record(self, results: List[Dict], source: str) -> int:
+        """
+        Add exported drafts to the index and persist them
+
+        Args:
+            results: Exported result dicts from TweetGenerator (with tweet_drafts)
+            source: Board fingerprint the drafts came from
+
+        Returns:
+            Number of drafts recorded
+        """
+        now = time.time()
+        recorded = 0
+        changed = []
+        with self._lock:
+            self._read_log()
+            for result in results:
+                for draft in result.get('tweet_drafts') or []:
+                    if not draft:
+                        continue
+                    entry_id = hashlib.sha1('|'.join([
+                        source or '', result['market'], result['team_player'], draft['version'], draft['content']
+                    ]).encode('utf-8')).hexdigest()[:16]
+
+                    existing = self._entries.get(entry_id)
+                    if existing is not None:
+                        # Re-exported: counts as used again for rotation
+                        existing['recorded_at'] = now
+                        changed.append(existing)
+                        continue
+
+                    entry = {
+                        'id': entry_id,
+                        'source': source,
+                        'market': result['market'],
+                        'team_player': result['team_player'],
+                        'version': draft['version'],
+                        'kind': 'exported',
+                        'recorded_at': now,
+                        'signature': self.signature(draft['content'])
+                    }
+                    self._add(entry)
+                    changed.append(entry)
+                    recorded += 1
+            self._prune()
+            lines = [self._serialize(entry) for entry in changed]
+
+        self._append(lines)
+        return recorded
+
+    def _add(self, entry: Dict) -> None:
+        self._entries[entry['id']] = entry
+        self._exports.setdefault((entry['market'], entry['team_player']), set()).add(entry['id'])
+        for key in self._band_keys(entry['signature']):
+            self._buckets.setdefault(key, set()).add(entry['id'])
+
+    def _remove(self, entry_id: str) -> None:
+        entry = self._entries.pop(entry_id, None)
+        if entry is None:
+            return
+        exports = self._exports.get((entry['market'], entry['team_player']))
+        if exports is not None:
+            exports.discard(entry_id)
+        for key in self._band_keys(entry['signature']):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def _prune(self) -> None:
+        """Apply age and size retention"""
+        cutoff = time.time() - self.max_age_days * 86400
+        for entry_id in [e['id'] for e in self._entries.values() if e['recorded_at'] < cutoff]:
+            self._remove(entry_id)
+        if len(self._entries) > self.max_entries:
+            oldest = sorted(self._entries.values(), key=lambda e: e['recorded_at'])
+            for entry in oldest[:len(self._entries) - self.max_entries]:
+                self._remove(entry['id'])
+
+    # --- persistence ----------------------------------------------------
+
+    @staticmethod
+    def _serialize(entry: Dict) -> str:
+        return json.dumps(dict(entry, signature=entry['signature'].tolist())) + '\n'
+
+    def _apply_line(self, entry: Dict) -> None:
+        """Merge one logged entry (a later line for a known id updates its time)"""
+        if entry.get('kind') != 'exported':
+            return  # 'generated' records written by older versions aren't used
+        existing = self._entries.get(entry['id'])
+        if existing is None:
+            if len(entry['signature']) != self.num_perm:
+                return  # Signatures from a different configuration can't be compared
+            entry['signature'] = np.array(entry['signature'], dtype=np.uint64)
+            self._add(entry)
+            return
+        existing['recorded_at'] = max(existing['recorded_at'], entry['recorded_at'])
+
+    def _read_log(self) -> bool:
+        """
+        Merge lines appended since the last read (caller holds _lock)
+
+        Returns:
+            True if the file was a whole-file snapshot from an older version
+        """
+        if self.path is None:
+            return False
+        try:
+            with open(self.path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                if stat.st_ino != self._log_inode or stat.st_size < self._log_offset:
+                    # New or compacted file: read it from the start (known ids merge)
+                    self._log_inode = stat.st_ino
+                    self._log_offset = 0
+                    self._log_lines = 0
+                if stat.st_size == self._log_offset:
+                    return False
+                f.seek(self._log_offset)
+                data = f.read(stat.st_size - self._log_offset)
+        except OSError:
+            return False
+
+        if self._log_offset == 0 and data.startswith(b'{"num_perm"'):
+            # Whole-file snapshot written by older versions
+            try:
+                snapshot = json.loads(data)
+            except ValueError:
+                return False
+            for entry in snapshot.get('entries', []):
+                self._apply_line(entry)
+            self._log_offset = len(data)
+            return True
+
+        # A partial last line is being written by another worker; read it next time
+        end = data.rfind(b'\n') + 1
+        self._log_offset += end
+        for line in data[:end].splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            self._log_lines += 1
+            if 'id' in record:
+                self._apply_line(record)
+        return False
+
+    def load(self) -> None:
+        """Merge entries from disk (missing or unreadable files start empty)"""
+        with self._lock:
+            legacy = self._read_log()
+            self._prune()
+        if legacy:
+            self.save()  # Convert to the log format before anything is appended
+
+    def refresh(self) -> None:
+        """Pick up entries other workers appended since the last read"""
+        with self._lock:
+            self._read_log()
+
+    def _append(self, lines: List[str]) -> None:
+        """Append entry lines to the log (read-only filesystems keep the index in memory)"""
+        if self.path is None or not lines:
+            return
+        try:
+            with self._write_lock:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                # One O_APPEND write, so concurrent workers' lines don't interleave
+                fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    os.write(fd, ''.join(lines).encode('utf-8'))
+                finally:
+                    os.close(fd)
+        except OSError:
+            return
+
+        with self._lock:
+            self._log_lines += len(lines)
+            if self._log_lines > max(2 * len(self._entries), 1000) and self._compacting is None:
+                self._compacting = threading.Thread(target=self._compact, name='draft-index-compact',
+                                                    daemon=True)
+                self._compacting.start()
+
+    def _compact(self) -> None:
+        """
+        Rewrite the log with one line per live entry
+
+        Lines another worker appends to the old file while it is being
+        replaced are lost; the index only drives advisory flags.
+        """
+        try:
+            with self._write_lock:
+                with self._lock:
+                    self._read_log()
+                    self._prune()
+                    lines = [self._serialize(entry) for entry in self._entries.values()]
+                folder = os.path.dirname(self.path) or '.'
+                fd, tmp_path = tempfile.mkstemp(dir=folder, prefix='.draft-index-')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.writelines(lines)
+                os.replace(tmp_path, self.path)
+                with self._lock:
+                    stat = os.stat(self.path)
+                    self._log_inode = stat.st_ino
+                    self._log_offset = stat.st_size
+                    self._log_lines = len(lines)
+        except OSError:
+            pass
+        finally:
+            self._compacting = None
+
+    def save(self) -> None:
+        """Rewrite the log compactly now (normally done in the background)"""
+        if self.path is not None:
+            self._compact()
+
+    def __len__(self) -> int:
+        return len(self._entries)
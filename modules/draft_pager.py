@@ -0,0 +1,174 @@
+"""
+Draft Pager Module
+Lazy, paginated tweet draft materialization with an LRU of rendered drafts
+"""
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .tweet_generator import TweetGenerator
+
+
+class LazyDraftBatch:
+    """
+    Mover metadata plus draft handles; drafts render only when requested
+
+    Handles look like "<batch_id>-<mover_id>-<draft_index>". Templates are
+    pinned per mover when the batch is created, so a template hot reload
+    never changes what an existing handle renders.
+    """
+
+    FILTERS = ('market', 'direction', 'magnitude')
+
+    def __init__(self, generator: TweetGenerator, movers: pd.DataFrame,
+                 contexts: Dict = None, cache_size: int = 512):
+        """
+        Initialize batch
+
+        Args:
+            generator: TweetGenerator used for rendering
+            movers: DataFrame of movers
+            contexts: Optional dict mapping team_player -> context string
+            cache_size: Max rendered drafts kept in the LRU
+        """
+        self.generator = generator
+        self.batch_id = uuid.uuid4().hex[:8]
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        self.movers = movers.to_dict('records')
+        self.contexts = generator.resolve_contexts(self.movers, contexts)
+
+        self.templates = []
+        self.entries = []
+        for mover_id, mover in enumerate(self.movers):
+            templates = generator.get_mover_templates(mover)
+            entry = generator.describe_mover(mover, self.contexts.get(mover['team_player']))
+            entry['mover_id'] = mover_id
+            entry['drafts'] = [
+                {'handle': self._handle(mover_id, index), 'version': template['name']}
+                for index, template in enumerate(templates)
+            ]
+            self.templates.append(templates)
+            self.entries.append(entry)
+
+    def _handle(self, mover_id: int, index: int) -> str:
+        return f'{self.batch_id}-{mover_id}-{index}'
+
+    def _parse_handle(self, handle: str) -> Optional[tuple]:
+        """Split a handle into (mover_id, draft_index), or None if it isn't ours"""
+        try:
+            batch_id, mover_id, index = handle.split('-')
+            mover_id, index = int(mover_id), int(index)
+        except ValueError:
+            return None
+        if batch_id != self.batch_id or not 0 <= mover_id < len(self.movers):
+            return None
+        if not 0 <= index < len(self.templates[mover_id]):
+            return None
+        return mover_id, index
+
+    def get_draft(self, handle: str) -> Optional[Dict]:
+        """
+        Render (or fetch from the LRU) a single draft
+
+        Args:
+            handle: Draft handle
+
+        Returns:
+            Draft dictionary, or None for an unknown handle
+        """
+        with self._cache_lock:
+            draft = self._cache.get(handle)
+            if draft is not None:
+                self._cache.move_to_end(handle)
+                return draft
+
+        parsed = self._parse_handle(handle)
+        if parsed is None:
+            return None
+        mover_id, index = parsed
+
+        draft = self.generator.render_draft(
+            self.movers[mover_id],
+            self.templates[mover_id][index],
+            self.entries[mover_id]['context_used']
+        )
+        draft['handle'] = handle
+
+        # Rendered outside the lock; a concurrent render of the same handle just wins the slot
+        with self._cache_lock:
+            self._cache[handle] = draft
+            self._cache.move_to_end(handle)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return draft
+
+    def filter(self, market: str = None, direction: str = None, magnitude: str = None) -> List[Dict]:
+        """
+        Filter mover entries
+
+        Args:
+            market: Exact market name
+            direction: 'up'/'down' (or 'riser'/'faller')
+            magnitude: Magnitude classification
+
+        Returns:
+            Matching entries (metadata only)
+        """
+        if direction in ('riser', 'faller'):
+            direction = 'up' if direction == 'riser' else 'down'
+
+        entries = self.entries
+        if market:
+            entries = [e for e in entries if e['market'] == market]
+        if direction:
+            entries = [e for e in entries if e['movement']['direction'] == direction]
+        if magnitude:
+            entries = [e for e in entries if e['movement']['magnitude'] == magnitude]
+        return entries
+
+    def page(self, page: int = 1, per_page: int = 10, **filters) -> Dict:
+        """
+        Render one page of movers with their drafts
+
+        Args:
+            page: 1-based page number
+            per_page: Movers per page
+            **filters: market/direction/magnitude filters
+
+        Returns:
+            Dictionary with rendered results and paging info
+        """
+        page = max(int(page), 1)
+        per_page = max(int(per_page), 1)
+        entries = self.filter(**{k: v for k, v in filters.items() if k in self.FILTERS})
+
+        start = (page - 1) * per_page
+        results = [self._materialize(e) for e in entries[start:start + per_page]]
+
+        return {
+            'results': results,
+            'page': page,
+            'per_page': per_page,
+            'total': len(entries),
+            'pages': (len(entries) + per_page - 1) // per_page
+        }
+
+    def _materialize(self, entry: Dict) -> Dict:
+        """Build a full result dict (same shape as generate_for_mover) for an entry"""
+        result = {k: v for k, v in entry.items() if k != 'drafts'}
+        result['tweet_drafts'] = [self.get_draft(d['handle']) for d in entry['drafts']]
+        return result
+
+    def materialize_all(self) -> List[Dict]:
+        """Render every draft (used for export)"""
+        return [self._materialize(e) for e in self.entries]
+
+    def summary(self) -> List[Dict]:
+        """Mover metadata with draft handles (nothing rendered)"""
+        return self.entries
@@ -0,0 +1,280 @@
+"""
+Live Board Module
+Mutable in-memory board that applies delta uploads through a (market, team_player) hash index
+"""
+import bisect
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .aggregation import SummaryAggregator
+from .board_store import BoardStore
+from .csv_processor import CSVProcessor
+from .movers_analyzer import MoversAnalyzer
+
+KEY_COLUMNS = ['market', 'team_player']
+
+
+class LiveBoard:
+    """
+    Board that can be patched row by row
+
+    Columns live in growable NumPy arrays; a dict maps each
+    (market, team_player) key to its row position, so a delta upload only
+    touches the rows it names. Alongside the rows the board keeps:
+
+    - a SummaryAggregator over all rows (old values are removed and new ones
+      added, a market is only rescanned when its extreme row changed)
+    - per threshold, the ranking of qualifying rows as a sorted list of
+      (-abs_change, position), updated with bisect on every change
+
+    frame() is a zero-copy view: frames handed out earlier see later patches.
+    """
+
+    MAX_RANKINGS = 4  # Thresholds kept ranked at once
+
+    def __init__(self, df: pd.DataFrame, board_id: str = None):
+        """
+        Build from a cleaned board (one O(rows) pass)
+
+        Args:
+            df: Cleaned board (CSVProcessor output or a stored board)
+            board_id: Fingerprint of df (computed if not given)
+        """
+        df = df.reset_index(drop=True)
+        self.board_id = board_id or BoardStore.fingerprint(df)
+        self._size = len(df)
+        capacity = self._size + max(self._size // 4, 64)
+
+        self._columns = {}
+        for col in df.columns:
+            series = df[col]
+            if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                values = series.to_numpy()
+            else:
+                values = series.astype(object).where(series.notna(), None).to_numpy(dtype=object)
+            column = np.empty(capacity, dtype=values.dtype)
+            column[:self._size] = values
+            self._columns[col] = column
+
+        markets = self._columns['market'][:self._size].tolist()
+        players = self._columns['team_player'][:self._size].tolist()
+        self._index = dict(zip(zip(markets, players), range(self._size)))
+        self._market_rows = {}
+        for position, market in enumerate(markets):
+            self._market_rows.setdefault(market, []).append(position)
+
+        self._aggregator = SummaryAggregator()
+        self._aggregator.add(self._rows_frame(np.arange(self._size)), np.arange(self._size))
+        self._rankings = OrderedDict()
+        self._lock = threading.Lock()
+        self._frame = None
+
+    @classmethod
+    def empty(cls) -> 'LiveBoard':
+        """Board with the standard columns and no rows (filled by deltas)"""
+        df = pd.DataFrame({
+            col: pd.Series(dtype=float if col in CSVProcessor.NUMERIC_COLUMNS else object)
+            for col in CSVProcessor.REQUIRED_COLUMNS
+        })
+        return cls(df)
+
+    def __len__(self) -> int:
+        return self._size
+
+    # --- views ----------------------------------------------------------
+
+    def frame(self) -> pd.DataFrame:
+        """Current board as a DataFrame sharing this board's arrays"""
+        with self._lock:
+            if self._frame is None:
+                self._frame = pd.DataFrame(
+                    {col: values[:self._size] for col, values in self._columns.items()}, copy=False
+                )
+                self._frame.attrs['board_id'] = self.board_id
+            return self._frame
+
+    def snapshot(self) -> Tuple[pd.DataFrame, str]:
+        """Independent copy of the board (e.g. for writing to the board store) and its id"""
+        with self._lock:
+            df = pd.DataFrame({col: values[:self._size].copy() for col, values in self._columns.items()})
+            return df, self.board_id
+
+    def _rows_frame(self, positions: np.ndarray, columns: List[str] = None) -> pd.DataFrame:
+        columns = columns or ['market', 'team_player', 'change_pct']
+        return pd.DataFrame({col: self._columns[col][positions] for col in columns}, index=positions)
+
+    def board_summary(self) -> Dict:
+        """Summary in the shape of CSVProcessor.get_summary"""
+        with self._lock:
+            summary = self._aggregator.board_summary()
+            summary['by_market'] = self._aggregator.market_breakdown()
+            return summary
+
+    # --- movers ---------------------------------------------------------
+
+    def _ranking(self, threshold: float) -> List[Tuple[float, int]]:
+        """Qualifying rows for a threshold, best first (built on first use)"""
+        ranking = self._rankings.get(threshold)
+        if ranking is not None:
+            self._rankings.move_to_end(threshold)
+            return ranking
+
+        abs_change = np.abs(self._columns['change_pct'][:self._size].astype(float))
+        positions = np.flatnonzero(abs_change >= threshold)
+        order = np.lexsort((positions, -abs_change[positions]))
+        positions = positions[order]
+        ranking = list(zip((-abs_change[positions]).tolist(), positions.tolist()))
+
+        self._rankings[threshold] = ranking
+        if len(self._rankings) > self.MAX_RANKINGS:
+            self._rankings.popitem(last=False)
+        return ranking
+
+    def top_movers(self, threshold: float, top_n: int) -> pd.DataFrame:
+        """
+        Ranked movers, same shape as MoversAnalyzer.identify_movers
+
+        Args:
+            threshold: Minimum absolute % change
+            top_n: Number of movers to return
+
+        Returns:
+            DataFrame of movers indexed by board row position
+        """
+        with self._lock:
+            positions = np.array([p for _, p in self._ranking(float(threshold))[:top_n]], dtype=np.int64)
+            movers = self._rows_frame(positions, list(self._columns))
+        movers['abs_change'] = movers['change_pct'].abs()
+        return MoversAnalyzer.annotate(movers)
+
+    def analysis(self, threshold: float, top_n: int) -> Tuple[pd.DataFrame, Dict]:
+        """
+        Movers and their summary for a threshold/top_n
+
+        Returns:
+            (movers, movers summary) as produced by MoversAnalyzer
+        """
+        movers = self.top_movers(threshold, top_n)
+        analyzer = MoversAnalyzer(None, {'movement_threshold': threshold, 'top_n_movers': top_n})
+        analyzer.movers = movers
+        return movers, analyzer.get_movers_summary()
+
+    # --- patching -------------------------------------------------------
+
+    def apply(self, delta: pd.DataFrame) -> Dict:
+        """
+        Upsert changed rows
+
+        Rows whose key exists are updated in place (identical rows are
+        skipped), others are appended. Cost is proportional to the delta,
+        plus a rescan of a market whose extreme value changed.
+
+        Args:
+            delta: Cleaned rows (CSVProcessor output), later duplicates win
+
+        Returns:
+            Counts of updated, inserted and unchanged rows and the new board id
+        """
+        delta = delta.drop_duplicates(subset=KEY_COLUMNS, keep='last').reset_index(drop=True)
+        markets = delta['market'].astype(str).tolist()
+        players = delta['team_player'].astype(str).tolist()
+        columns = [col for col in self._columns if col in delta.columns and col not in KEY_COLUMNS]
+
+        with self._lock:
+            positions = np.array([self._index.get(key, -1) for key in zip(markets, players)], dtype=np.int64)
+            updates = np.flatnonzero(positions >= 0)
+            updates = updates[self._changed(delta, columns, updates, positions[updates])]
+            update_positions = positions[updates]
+            inserts = np.flatnonzero(positions < 0)
+
+            result = {'updated': len(updates), 'inserted': len(inserts),
+                      'unchanged': len(delta) - len(updates) - len(inserts)}
+            if not len(updates) and not len(inserts):
+                result['board_id'] = self.board_id
+                return result
+
+            # Old values of updated rows leave the summaries and rankings
+            old_change = self._columns['change_pct'][update_positions].astype(float)
+            self._aggregator.remove(self._rows_frame(update_positions), update_positions)
+            for col in columns:
+                self._assign(col, update_positions, delta[col].to_numpy()[updates])
+
+            insert_positions = np.arange(self._size, self._size + len(inserts))
+            self._reserve(self._size + len(inserts))
+            for col in self._columns:
+                if col in delta.columns:
+                    values = delta[col].to_numpy()[inserts]
+                elif self._columns[col].dtype == object:
+                    values = np.full(len(inserts), None, dtype=object)
+                else:
+                    values = np.full(len(inserts), np.nan)
+                self._assign(col, insert_positions, values)
+            for index, position in zip(inserts.tolist(), insert_positions.tolist()):
+                self._index[(markets[index], players[index])] = position
+                self._market_rows.setdefault(markets[index], []).append(position)
+            self._size += len(inserts)
+
+            touched = np.concatenate([update_positions, insert_positions])
+            self._aggregator.add(self._rows_frame(touched), touched)
+            for market in self._aggregator.pop_stale():
+                rows = np.array(self._market_rows[market], dtype=np.int64)
+                self._aggregator.rebuild_market(market, self._rows_frame(rows), rows)
+
+            new_change = self._columns['change_pct'][touched].astype(float)
+            for threshold, ranking in self._rankings.items():
+                for position, change in zip(update_positions.tolist(), old_change.tolist()):
+                    if abs(change) >= threshold:
+                        entry = (-abs(change), position)
+                        del ranking[bisect.bisect_left(ranking, entry)]
+                for position, change in zip(touched.tolist(), new_change.tolist()):
+                    if abs(change) >= threshold:
+                        bisect.insort(ranking, (-abs(change), position))
+
+            # Chain the id so every worker derives the same id for the same base + delta
+            digest = hashlib.sha1(self.board_id.encode('utf-8'))
+            digest.update(BoardStore.fingerprint(self._rows_frame(touched, list(self._columns))).encode('utf-8'))
+            self.board_id = digest.hexdigest()[:16]
+            self._frame = None
+
+            result['board_id'] = self.board_id
+            return result
+
+    def _changed(self, delta: pd.DataFrame, columns: List[str], rows: np.ndarray,
+                 positions: np.ndarray) -> np.ndarray:
+        """Mask of delta rows that differ from the board"""
+        changed = np.zeros(len(rows), dtype=bool)
+        for col in columns:
+            old = self._columns[col][positions]
+            new = delta[col].to_numpy()[rows]
+            if old.dtype == object or new.dtype == object:
+                changed |= pd.Series(old, dtype=object).ne(pd.Series(new, dtype=object)).to_numpy() & \
+                    ~(pd.isna(old) & pd.isna(new))
+            else:
+                changed |= ~((old == new) | (np.isnan(old.astype(float)) & np.isnan(new.astype(float))))
+        return changed
+
+    def _assign(self, col: str, positions: np.ndarray, values: np.ndarray) -> None:
+        """Write values into a column, widening integer columns that receive NaN/fractions"""
+        column = self._columns[col]
+        if column.dtype.kind in 'iu' and values.dtype.kind == 'f' and \
+                (np.isnan(values).any() or not np.all(np.mod(values, 1) == 0)):
+            column = self._columns[col] = column.astype(np.float64)
+        if column.dtype == object:
+            values = pd.Series(values, dtype=object).where(pd.notna(values), None).to_numpy(dtype=object)
+        column[positions] = values
+
+    def _reserve(self, size: int) -> None:
+        """Grow column arrays (doubling) so appends are amortized O(1)"""
+        capacity = len(self._columns['market'])
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2)
+        for col, values in self._columns.items():
+            grown = np.empty(capacity, dtype=values.dtype)
+            grown[:self._size] = values[:self._size]
+            self._columns[col] = grown
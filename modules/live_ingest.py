@@ -0,0 +1,404 @@
+"""
+Live Ingest Module
+Watches odds feeds, patches an in-memory board and pushes newly qualifying movers over SSE
+"""
+import io
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .compressed_upload import open_csv_stream
+from .csv_processor import CSVProcessor
+from .live_board import LiveBoard
+
+
+# --- feeds ----------------------------------------------------------------------
+
+class DirectoryFeed:
+    """
+    Folder where each new CSV file is one update
+
+    Writers should create files atomically (write elsewhere or under a
+    dot/.tmp/.part name, then rename). Files are picked up in modification
+    order; a file is read again only if it is rewritten.
+    """
+
+    EXTENSIONS = ('.csv', '.gz', '.zst', '.zip')
+    IGNORED_SUFFIXES = ('.tmp', '.part')
+
+    def __init__(self, folder: str, skip_existing: bool = True):
+        """
+        Initialize feed
+
+        Args:
+            folder: Folder to watch (created if missing)
+            skip_existing: Ignore files already there (only react to new drops)
+        """
+        self.folder = folder
+        self._seen = set()
+        os.makedirs(folder, exist_ok=True)
+        if skip_existing:
+            self._seen = {(e.name, e.stat().st_mtime_ns) for e in os.scandir(folder) if e.is_file()}
+
+    def poll(self) -> List[Tuple[str, BinaryIO]]:
+        """
+        New files since the last poll
+
+        Returns:
+            List of (source name, CSV byte stream)
+        """
+        try:
+            entries = [e for e in os.scandir(self.folder) if e.is_file()]
+        except OSError:
+            return []
+
+        updates = []
+        for entry in sorted(entries, key=lambda e: (e.stat().st_mtime, e.name)):
+            name = entry.name
+            if name.startswith('.') or name.endswith(self.IGNORED_SUFFIXES) or \
+                    not name.lower().endswith(self.EXTENSIONS):
+                continue
+            key = (name, entry.stat().st_mtime_ns)
+            if key in self._seen:
+                continue
+            self._seen.add(key)
+            try:
+                with open(entry.path, 'rb') as f:
+                    data = f.read()
+            except OSError:
+                continue
+            updates.append((name, open_csv_stream(io.BytesIO(data), name)))
+        return updates
+
+
+class TailFeed:
+    """
+    Append-only JSON-lines file standing in for a push feed
+
+    Each line is one row object with the CSV columns; lines appended since
+    the last poll form one update. A truncated file is read from the start.
+    """
+
+    def __init__(self, path: str, skip_existing: bool = True):
+        """
+        Initialize feed
+
+        Args:
+            path: JSON-lines file to tail (may not exist yet)
+            skip_existing: Start at the current end of the file
+        """
+        self.path = path
+        self._offset = 0
+        if skip_existing and os.path.exists(path):
+            self._offset = os.path.getsize(path)
+
+    def poll(self) -> List[Tuple[str, BinaryIO]]:
+        """
+        Rows appended since the last poll, as one CSV update
+
+        Returns:
+            List with zero or one (source name, CSV byte stream)
+        """
+        try:
+            size = os.path.getsize(self.path)
+            if size < self._offset:
+                self._offset = 0
+            if size == self._offset:
+                return []
+            with open(self.path, 'rb') as f:
+                f.seek(self._offset)
+                data = f.read(size - self._offset)
+        except OSError:
+            return []
+
+        # Only consume complete lines; a partial last line is read next time
+        end = data.rfind(b'\n') + 1
+        self._offset += end
+        rows = []
+        for line in data[:end].splitlines():
+            try:
+                rows.append(json.loads(line))
+            except ValueError:
+                continue  # Blank or malformed line
+        if not rows:
+            return []
+
+        csv_bytes = pd.DataFrame(rows).to_csv(index=False).encode('utf-8')
+        return [(os.path.basename(self.path), io.BytesIO(csv_bytes))]
+
+
+# --- events ---------------------------------------------------------------------
+
+class Subscription:
+    """One subscriber's bounded event queue (oldest events dropped when it falls behind)"""
+
+    def __init__(self, maxsize: int):
+        self._queue = queue.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def put(self, event: Optional[Dict]) -> None:
+        while True:
+            try:
+                self._queue.put_nowait(event)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def get(self, timeout: float) -> Optional[Dict]:
+        """
+        Next event
+
+        Returns:
+            Event dict, {} on timeout (send a heartbeat), or None when the broker closed
+        """
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return {}
+
+
+class EventBroker:
+    """
+    Fan-out of events to SSE subscribers
+
+    Events get increasing ids and the most recent ones are kept, so a client
+    reconnecting with Last-Event-ID receives what it missed.
+    """
+
+    def __init__(self, queue_size: int = 256, replay: int = 500):
+        """
+        Initialize broker
+
+        Args:
+            queue_size: Max undelivered events per subscriber
+            replay: Recent events kept for reconnecting clients
+        """
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._recent = deque(maxlen=replay)
+        self._next_id = 1
+
+    def publish(self, event_type: str, data: Dict) -> Dict:
+        """Send an event to every subscriber"""
+        with self._lock:
+            event = {'id': self._next_id, 'type': event_type, 'data': data}
+            self._next_id += 1
+            self._recent.append(event)
+            for subscription in self._subscribers:
+                subscription.put(event)
+        return event
+
+    def subscribe(self, last_event_id: int = None) -> Subscription:
+        """
+        Register a subscriber
+
+        Args:
+            last_event_id: Replay buffered events after this id
+
+        Returns:
+            Subscription to read events from
+        """
+        subscription = Subscription(self.queue_size)
+        with self._lock:
+            if last_event_id is not None:
+                for event in self._recent:
+                    if event['id'] > last_event_id:
+                        subscription.put(event)
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def close(self) -> None:
+        """End every subscriber's stream"""
+        with self._lock:
+            for subscription in self._subscribers:
+                subscription.put(None)
+            self._subscribers = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @staticmethod
+    def format_sse(event: Dict) -> str:
+        """Serialize an event in text/event-stream format"""
+        data = json.dumps(event['data'], default=str)
+        return f"id: {event['id']}\nevent: {event['type']}\ndata: {data}\n\n"
+
+
+# --- ingestion ------------------------------------------------------------------
+
+class LiveIngestor:
+    """
+    Applies feed updates to a LiveBoard and announces movers entering the top list
+
+    Every update is upserted through the board's hash index and the running
+    ranking is re-read and rendered; with a result cache on the generator
+    only movers whose numbers changed are actually re-rendered. Movers that
+    weren't in the top list before are published as 'mover' events. Each update also publishes an 'update' event with the
+    row counts, movers that dropped out and the processing latency.
+    """
+
+    def __init__(self, feeds: List, generator, threshold: float, top_n: int,
+                 board: LiveBoard = None, broker: EventBroker = None, poll_interval: float = 0.25):
+        """
+        Initialize ingestor
+
+        Args:
+            feeds: DirectoryFeed/TailFeed instances (anything with poll())
+            generator: TweetGenerator used to render drafts for new movers
+            threshold: Minimum absolute % change to qualify
+            top_n: Size of the running top-movers list
+            board: Board to start from (default: empty)
+            broker: EventBroker to publish to
+            poll_interval: Seconds between feed polls
+        """
+        self.feeds = feeds
+        self.generator = generator
+        self.threshold = threshold
+        self.top_n = top_n
+        self.board = board if board is not None else LiveBoard.empty()
+        self.broker = broker or EventBroker()
+        self.poll_interval = poll_interval
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._results = {}  # (market, team_player) -> rendered result of the current top list
+        self._top = []
+        self.stats = {'updates': 0, 'errors': 0, 'last_latency_ms': None, 'max_latency_ms': 0.0}
+
+        # Movers already on the board at start are the baseline, not news
+        self._refresh_top(announce=False)
+
+    # --- lifecycle ------------------------------------------------------
+
+    def start(self) -> None:
+        """Poll feeds on a background thread"""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='live-ingest', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling and end subscriber streams"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.broker.close()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except Exception as e:
+                # Keep watching; a bad update shouldn't end live mode
+                self.stats['errors'] += 1
+                self.broker.publish('error', {'error': str(e)})
+            self._stop.wait(self.poll_interval)
+
+    # --- ingestion ------------------------------------------------------
+
+    def poll_once(self) -> int:
+        """
+        Process everything the feeds have ready
+
+        Returns:
+            Number of updates applied
+        """
+        applied = 0
+        for feed in self.feeds:
+            for source, stream in feed.poll():
+                processor = CSVProcessor(file_object=stream, validate_rows=False)
+                if not processor.process():
+                    self.stats['errors'] += 1
+                    self.broker.publish('error', {'source': source, 'errors': processor.get_errors()})
+                    continue
+                self.ingest(processor.get_data(), source)
+                applied += 1
+        return applied
+
+    def ingest(self, rows: pd.DataFrame, source: str = None) -> Dict:
+        """
+        Apply one update and publish what changed
+
+        Args:
+            rows: Cleaned rows (CSVProcessor output)
+            source: Name of the feed file the rows came from
+
+        Returns:
+            The 'update' event data
+        """
+        started = time.perf_counter()
+        with self._lock:
+            changes = self.board.apply(rows)
+            entered, exited = self._refresh_top(announce=True)
+            latency_ms = round((time.perf_counter() - started) * 1000, 2)
+
+            self.stats['updates'] += 1
+            self.stats['last_latency_ms'] = latency_ms
+            self.stats['max_latency_ms'] = max(self.stats['max_latency_ms'], latency_ms)
+
+        for rank, result in entered:
+            self.broker.publish('mover', dict(result, rank=rank, board_id=changes['board_id']))
+        update = {
+            'source': source,
+            'delta': changes,
+            'entered': [{'market': r['market'], 'team_player': r['team_player'], 'rank': rank}
+                        for rank, r in entered],
+            'exited': [{'market': market, 'team_player': team_player} for market, team_player in exited],
+            'latency_ms': latency_ms
+        }
+        self.broker.publish('update', update)
+        return update
+
+    def _refresh_top(self, announce: bool) -> Tuple[List[Tuple[int, Dict]], List[Tuple[str, str]]]:
+        """Re-read the running ranking and render it (unchanged movers come from the result cache)"""
+        movers = self.board.top_movers(self.threshold, self.top_n)
+        keys = list(zip(movers['market'], movers['team_player']))
+        results = self.generator.generate_batch(movers) if keys else []
+
+        previous = set(self._top)
+        current = set(keys)
+        exited = [key for key in self._top if key not in current]
+        self._results = dict(zip(keys, results))
+        self._top = keys
+
+        entered = [(i + 1, self._results[key]) for i, key in enumerate(keys) if key not in previous]
+        return (entered if announce else []), exited
+
+    def snapshot(self) -> Dict:
+        """Current top movers with drafts (sent to new subscribers first)"""
+        with self._lock:
+            return {
+                'threshold': self.threshold,
+                'top_n': self.top_n,
+                'board_id': self.board.board_id,
+                'rows': len(self.board),
+                'movers': [dict(self._results[key], rank=i + 1) for i, key in enumerate(self._top)]
+            }
+
+    def status(self) -> Dict:
+        """Running state and latency counters"""
+        return dict(self.stats, running=self.running, subscribers=self.broker.subscriber_count,
+                    rows=len(self.board), threshold=self.threshold, top_n=self.top_n)
@@ -5,6 +5,9 @@ Identifies and ranks the biggest odds movers
 import pandas as pd
 from typing import List, Dict
 
+from .profiling import profile_stage
+from .aggregation import SummaryAggregator
+
 
 class MoversAnalyzer:
     """Analyze odds data to identify biggest movers"""
@@ -14,13 +17,14 @@ class MoversAnalyzer:
         Initialize analyzer with dataframe and configuration
 
         Args:
-            df: DataFrame with odds data
+            df: DataFrame with odds data (read only - may be a shared memory-mapped board)
             config: Configuration dict with thresholds
         """
-        self.df = df.copy()
+        self.df = df
         self.config = config
         self.movers = None
 
+    @profile_stage('identify_movers')
     def identify_movers(self) -> pd.DataFrame:
         """
         Identify significant movers based on threshold
@@ -30,17 +34,33 @@ class MoversAnalyzer:
         """
         threshold = self.config.get('movement_threshold', 2.0)
 
-        # Filter by threshold
-        self.df['abs_change'] = self.df['change_pct'].abs()
-        movers = self.df[self.df['abs_change'] >= threshold].copy()
+        # Filter by threshold (only the selected rows are copied)
+        abs_change = self.df['change_pct'].abs()
+        mask = abs_change >= threshold
+        movers = self.df[mask].copy()
+        movers['abs_change'] = abs_change[mask]
 
-        # Sort by absolute change (descending)
-        movers = movers.sort_values('abs_change', ascending=False)
+        # Sort by absolute change (descending); stable, so ties keep board order like LiveBoard's ranking
+        movers = movers.sort_values('abs_change', ascending=False, kind='mergesort')
 
         # Limit to top N
         top_n = self.config.get('top_n_movers', 10)
         movers = movers.head(top_n)
 
+        self.movers = self.annotate(movers)
+        return self.movers
+
+    @classmethod
+    def annotate(cls, movers: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add direction, category and magnitude columns to ranked movers
+
+        Args:
+            movers: Movers with change_pct and abs_change (modified in place)
+
+        Returns:
+            The same DataFrame
+        """
         # Add categorization
         movers['direction'] = movers['change_pct'].apply(
             lambda x: 'up' if x > 0 else 'down'
@@ -52,12 +72,12 @@ class MoversAnalyzer:
         })
 
         # Add magnitude classification
-        movers['magnitude'] = movers['abs_change'].apply(self._classify_magnitude)
+        movers['magnitude'] = movers['abs_change'].apply(cls._classify_magnitude)
 
-        self.movers = movers
         return movers
 
-    def _classify_magnitude(self, change: float) -> str:
+    @staticmethod
+    def _classify_magnitude(change: float) -> str:
         """
         Classify magnitude of change
 
@@ -133,15 +153,11 @@ class MoversAnalyzer:
         if self.movers is None:
             self.identify_movers()
 
-        return {
-            'total_movers': len(self.movers),
-            'risers_count': len(self.movers[self.movers['direction'] == 'up']),
-            'fallers_count': len(self.movers[self.movers['direction'] == 'down']),
-            'avg_change': round(self.movers['change_pct'].mean(), 2),
-            'biggest_riser': self._format_biggest_mover(self.get_top_risers(1)),
-            'biggest_faller': self._format_biggest_mover(self.get_top_fallers(1)),
-            'markets_affected': self.movers['market'].unique().tolist()
-        }
+        # All stats come from one grouped pass
+        aggregator = SummaryAggregator.from_frame(self.movers)
+        summary = aggregator.movers_summary()
+        summary['by_market'] = aggregator.market_breakdown()
+        return summary
 
     def _format_biggest_mover(self, df: pd.DataFrame) -> Dict:
         """Format biggest mover info"""
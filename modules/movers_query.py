@@ -0,0 +1,146 @@
+"""
+Movers Query Module
+Server-side filtering, sorting and cursor pagination over analyzed movers
+"""
+import base64
+import hashlib
+import json
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+class MoversQuery:
+    """Page through a movers DataFrame without re-sorting on every request"""
+
+    # Public sort name -> movers column
+    SORT_KEYS = {
+        'abs_change': 'abs_change',
+        'change': 'change_pct',
+        'market': 'market',
+        'team_player': 'team_player',
+        'odds': 'this_week_pct',  # Implied probability sorts the same way odds strength does
+    }
+    DEFAULT_SORT = 'abs_change'
+    MAX_LIMIT = 500
+
+    def __init__(self, movers: pd.DataFrame):
+        """
+        Initialize query over a movers DataFrame
+
+        Args:
+            movers: DataFrame returned by MoversAnalyzer.identify_movers
+        """
+        self.movers = movers.reset_index(drop=True)
+        self._orders = {}
+
+    def _normalize(self, sort: str = None, order: str = None, market: str = None,
+                   direction: str = None, magnitude: str = None) -> Dict:
+        """Validate and normalize query parameters"""
+        sort = sort or self.DEFAULT_SORT
+        if sort not in self.SORT_KEYS:
+            raise ValueError(f"Unknown sort '{sort}'. Use one of: {', '.join(self.SORT_KEYS)}")
+
+        # Numeric sorts default to largest first, text sorts to A-Z
+        if order is None:
+            order = 'asc' if sort in ('market', 'team_player') else 'desc'
+        if order not in ('asc', 'desc'):
+            raise ValueError("order must be 'asc' or 'desc'")
+
+        if direction in ('riser', 'faller'):
+            direction = 'up' if direction == 'riser' else 'down'
+
+        return {
+            'sort': sort,
+            'order': order,
+            'market': market or None,
+            'direction': direction or None,
+            'magnitude': magnitude or None
+        }
+
+    def _query_key(self, query: Dict) -> str:
+        raw = json.dumps(query, sort_keys=True).encode('utf-8')
+        return hashlib.sha1(raw).hexdigest()[:12]
+
+    def _row_order(self, query: Dict) -> np.ndarray:
+        """Filtered + sorted row positions, cached per query"""
+        key = self._query_key(query)
+        positions = self._orders.get(key)
+        if positions is not None:
+            return positions
+
+        df = self.movers
+        mask = np.ones(len(df), dtype=bool)
+        for col in ('market', 'direction', 'magnitude'):
+            if query[col] is not None:
+                mask &= (df[col] == query[col]).to_numpy()
+
+        filtered = df[mask]
+        column = self.SORT_KEYS[query['sort']]
+        # Stable sort with team_player as tie-breaker so pages never overlap
+        filtered = filtered.sort_values(
+            [column, 'team_player'],
+            ascending=[query['order'] == 'asc', True],
+            kind='mergesort',
+            key=self._sort_key
+        )
+        positions = filtered.index.to_numpy()
+        self._orders[key] = positions
+        return positions
+
+    @staticmethod
+    def _sort_key(series: pd.Series) -> pd.Series:
+        """Sort categoricals (memory-mapped boards) by label, not category code"""
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return series.astype(str)
+        return series
+
+    def page(self, limit: int = 50, cursor: str = None, **params) -> Dict:
+        """
+        Get one page of movers
+
+        Args:
+            limit: Max movers to return
+            cursor: Opaque cursor from a previous page (None for the first page)
+            **params: sort, order, market, direction, magnitude
+
+        Returns:
+            Dictionary with movers records, total, next_cursor and applied query
+        """
+        query = self._normalize(**params)
+        key = self._query_key(query)
+        limit = min(max(int(limit), 1), self.MAX_LIMIT)
+        offset = self._decode_cursor(cursor, key) if cursor else 0
+
+        positions = self._row_order(query)
+        page_positions = positions[offset:offset + limit]
+        records = self.movers.iloc[page_positions].to_dict('records')
+
+        next_offset = offset + len(page_positions)
+        return {
+            'movers': records,
+            'total': len(positions),
+            'next_cursor': self._encode_cursor(next_offset, key) if next_offset < len(positions) else None,
+            'query': query
+        }
+
+    def markets(self) -> List[str]:
+        """Distinct markets (for filter controls)"""
+        return sorted(self.movers['market'].astype(str).unique().tolist())
+
+    @staticmethod
+    def _encode_cursor(offset: int, key: str) -> str:
+        raw = json.dumps({'o': offset, 'q': key}).encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii')
+
+    @staticmethod
+    def _decode_cursor(cursor: str, key: str) -> int:
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+            offset = int(data['o'])
+        except (ValueError, KeyError, TypeError):
+            raise ValueError('Invalid cursor')
+        if data.get('q') != key or offset < 0:
+            raise ValueError('Cursor does not match this query')
+        return offset
@@ -0,0 +1,189 @@
+"""
+Profiling Module
+Opt-in cProfile hooks for Flask requests and pipeline stages, dumped as .prof files
+"""
+import cProfile
+import functools
+import os
+import random
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+
+class Profiler:
+    """
+    Env/header gated profiler
+
+    Requests are profiled when profiling is enabled (subject to the sample
+    rate) or when the trigger header carries the configured token. Pipeline
+    stages decorated with profile_stage are timed inside a profiled request,
+    and profiled on their own when stage profiling is on outside a request
+    (e.g. the CLI). Profiles are written as pstats files, open them with
+    `python -m pstats` or snakeviz.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.stages_enabled = False
+        self.header = 'X-Profile'
+        self.token = None
+        self.folder = 'data/profiles'
+        self.sample_rate = 0.05
+        self.min_ms = 0.0
+        self.max_files = 50
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+    def configure(self, settings: Dict) -> None:
+        """
+        Apply settings
+
+        Args:
+            settings: Dict with profiling_* keys (see config.get_config)
+        """
+        self.enabled = settings.get('profiling_enabled', False)
+        self.stages_enabled = settings.get('profiling_stages', False)
+        self.header = settings.get('profiling_header', self.header)
+        self.token = settings.get('profiling_token') or None
+        self.folder = settings.get('profile_folder', self.folder)
+        self.sample_rate = settings.get('profile_sample_rate', self.sample_rate)
+        self.min_ms = settings.get('profile_min_ms', self.min_ms)
+        self.max_files = settings.get('profile_max_files', self.max_files)
+
+    @property
+    def active(self) -> Optional[Dict]:
+        """Profile state for the current thread, if a request is being profiled"""
+        return getattr(self._local, 'state', None)
+
+    def init_app(self, app) -> None:
+        """Register request hooks on a Flask app"""
+        from flask import request
+
+        @app.before_request
+        def _start_profile():
+            if self._should_profile_request(request.headers.get(self.header)):
+                self.start(request.endpoint or 'request')
+
+        @app.after_request
+        def _stop_profile(response):
+            path = self.stop()
+            if path is not None:
+                response.headers['X-Profile-File'] = os.path.basename(path)
+            return response
+
+        @app.teardown_request
+        def _discard_profile(error=None):
+            # Request failed before after_request ran
+            if self.active is not None:
+                self.stop()
+
+    def _should_profile_request(self, header_value: Optional[str]) -> bool:
+        if self.token is not None and header_value == self.token:
+            return True
+        return self.enabled and random.random() < self.sample_rate
+
+    def start(self, label: str) -> bool:
+        """
+        Start profiling the current thread
+
+        Returns:
+            False if profiling couldn't start (the request then runs unprofiled)
+        """
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Python 3.12+ allows one active profiler per process; another request holds it
+            return False
+        self._local.state = {
+            'label': label,
+            'profile': profile,
+            'started': time.perf_counter(),
+            'stages': {}
+        }
+        return True
+
+    def stop(self) -> Optional[str]:
+        """
+        Stop profiling the current thread and dump the profile
+
+        Returns:
+            Path of the written profile, or None if nothing was kept
+        """
+        state = self.active
+        if state is None:
+            return None
+        self._local.state = None
+
+        state['profile'].disable()
+        elapsed_ms = (time.perf_counter() - state['started']) * 1000
+        if elapsed_ms < self.min_ms:
+            return None
+        return self._dump(state['profile'], state['label'], elapsed_ms, state['stages'])
+
+    def _dump(self, profile: cProfile.Profile, label: str, elapsed_ms: float, stages: Dict) -> str:
+        """Write a pstats file (stage timings go in the name) and enforce retention"""
+        os.makedirs(self.folder, exist_ok=True)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        stage_part = ''.join(f'_{name}-{int(ms)}ms' for name, ms in stages.items())
+        filename = f'{timestamp}_{label}_{int(elapsed_ms)}ms{stage_part}.prof'
+        path = os.path.join(self.folder, filename.replace(os.sep, '_'))
+
+        with self._write_lock:
+            profile.dump_stats(path)
+            self._prune()
+        return path
+
+    def _prune(self) -> None:
+        """Keep only the newest max_files profiles"""
+        files = [
+            os.path.join(self.folder, name) for name in os.listdir(self.folder)
+            if name.endswith('.prof')
+        ]
+        if len(files) <= self.max_files:
+            return
+        files.sort(key=os.path.getmtime)
+        for path in files[:len(files) - self.max_files]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+profiler = Profiler()
+
+
+def profile_stage(name: str) -> Callable:
+    """
+    Decorator marking a pipeline stage for profiling
+
+    Costs one attribute check when profiling is off.
+
+    Args:
+        name: Stage name used in profile file names
+    """
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            state = profiler.active
+            if state is not None:
+                # Already inside a profiled request - just time the stage
+                started = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    elapsed = (time.perf_counter() - started) * 1000
+                    state['stages'][name] = state['stages'].get(name, 0) + elapsed
+
+            if not profiler.stages_enabled:
+                return fn(*args, **kwargs)
+
+            profiler.start(name)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                profiler.stop()
+        return wrapper
+    return decorator
@@ -0,0 +1,61 @@
+"""
+Result Cache Module
+Per-mover generation results keyed by a fingerprint of everything that shapes them
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+class ResultCache:
+    """
+    LRU of TweetGenerator results shared across generate calls
+
+    Keys come from TweetGenerator.result_fingerprint (mover row, context,
+    template version, render settings), so a regenerate only renders movers
+    whose inputs changed. Cached results are shared - treat them as read-only.
+    """
+
+    def __init__(self, max_entries: int = 2048):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Max results kept (least recently used dropped first)
+        """
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Cached result for a fingerprint, or None"""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: str, result: Dict) -> None:
+        """Store a freshly rendered result"""
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """Entry count and hit/miss counters"""
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+    def __len__(self) -> int:
+        return len(self._entries)
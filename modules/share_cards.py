@@ -0,0 +1,297 @@
+"""
+Share Cards Module
+Renders share-card images for movers with cached layers and a long-lived process pool
+"""
+import io
+import json
+import multiprocessing
+import os
+import re
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:  # Share cards are optional
+    Image = ImageDraw = ImageFont = None
+
+from .template_registry import get_registry
+
+
+class ShareCardRenderer:
+    """
+    Draw a card from the `movement` block of a generation result
+
+    Static pieces are built once per process and reused: the background
+    (gradient, family title and logo) per market family and direction, and a
+    glyph atlas of odds characters that is pasted instead of re-rasterizing
+    text for every card.
+    """
+
+    WIDTH = 1200
+    HEIGHT = 675
+
+    # Market family -> (accent color, title)
+    THEMES = {
+        'playoffs': ((0, 102, 204), 'PLAYOFF ODDS'),
+        'mvp': ((153, 102, 0), 'MVP ODDS'),
+        'championship': ((128, 0, 128), 'CHAMPIONSHIP ODDS'),
+        'generic': ((51, 51, 51), 'FUTURES ODDS'),
+    }
+    UP_COLOR = (40, 167, 69)
+    DOWN_COLOR = (220, 53, 69)
+    TEXT_COLOR = (255, 255, 255)
+    GLYPHS = '0123456789+-.%'
+    FONT_CANDIDATES = [
+        'DejaVuSans-Bold.ttf',
+        '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
+        'Arial Bold.ttf',
+        'arialbd.ttf',
+    ]
+
+    def __init__(self, font_path: str = None, logo_path: str = None, template_folder: str = None):
+        """
+        Initialize renderer
+
+        Args:
+            font_path: TrueType font (falls back to common system fonts)
+            logo_path: Optional logo image pasted on every card
+            template_folder: Template folder whose routing decides each market's family
+        """
+        if Image is None:
+            raise RuntimeError('Share cards require Pillow (pip install Pillow)')
+
+        self.font_path = font_path
+        self.logo_path = logo_path
+        self._fonts = {}
+        self._backgrounds = {}
+        self._glyphs = {}
+        self._logo = None
+        self._families = get_registry(template_folder)
+
+    # --- cached layers --------------------------------------------------
+
+    def _font(self, size: int):
+        font = self._fonts.get(size)
+        if font is None:
+            for candidate in ([self.font_path] if self.font_path else []) + self.FONT_CANDIDATES:
+                try:
+                    font = ImageFont.truetype(candidate, size)
+                    break
+                except (OSError, ValueError):
+                    continue
+            if font is None:
+                font = ImageFont.load_default()
+            self._fonts[size] = font
+        return font
+
+    def _load_logo(self):
+        if self._logo is None and self.logo_path and os.path.exists(self.logo_path):
+            logo = Image.open(self.logo_path).convert('RGBA')
+            logo.thumbnail((160, 80))
+            self._logo = logo
+        return self._logo
+
+    def _background(self, family: str, direction: str):
+        """Gradient, family title and logo for a family/direction (built once)"""
+        key = (family, direction)
+        background = self._backgrounds.get(key)
+        if background is not None:
+            return background
+
+        accent, title = self.THEMES.get(family, self.THEMES['generic'])
+        mood = self.UP_COLOR if direction == 'up' else self.DOWN_COLOR
+
+        # Vertical gradient from the family accent towards the direction color
+        gradient = Image.linear_gradient('L').resize((self.WIDTH, self.HEIGHT))
+        background = Image.composite(
+            Image.new('RGB', (self.WIDTH, self.HEIGHT), tuple(c // 3 for c in mood)),
+            Image.new('RGB', (self.WIDTH, self.HEIGHT), accent),
+            gradient
+        )
+
+        draw = ImageDraw.Draw(background)
+        draw.text((60, 50), title, font=self._font(44), fill=self.TEXT_COLOR)
+        draw.rectangle((60, 110, 260, 116), fill=mood)
+
+        logo = self._load_logo()
+        if logo is not None:
+            background.paste(logo, (self.WIDTH - logo.width - 60, 40), logo)
+
+        self._backgrounds[key] = background
+        return background
+
+    def _glyph_atlas(self, size: int) -> Dict[str, object]:
+        """Pre-rendered odds characters at a given size (white on transparent)"""
+        atlas = self._glyphs.get(size)
+        if atlas is None:
+            font = self._font(size)
+            atlas = {}
+            for char in self.GLYPHS:
+                left, top, right, bottom = font.getbbox(char)
+                advance = int(round(font.getlength(char)))
+                glyph = Image.new('L', (max(advance, right), size + size // 3), 0)
+                ImageDraw.Draw(glyph).text((0, 0), char, font=font, fill=255)
+                atlas[char] = (glyph, advance)
+            self._glyphs[size] = atlas
+        return atlas
+
+    def _paste_text(self, card, text: str, xy: tuple, size: int, color: tuple) -> int:
+        """Compose text from the glyph atlas; falls back to draw.text for other characters"""
+        atlas = self._glyph_atlas(size)
+        x, y = xy
+        fill = Image.new('RGB', (1, 1), color)
+        for char in text:
+            entry = atlas.get(char)
+            if entry is None:
+                draw = ImageDraw.Draw(card)
+                draw.text((x, y), char, font=self._font(size), fill=color)
+                x += int(round(self._font(size).getlength(char)))
+                continue
+            glyph, advance = entry
+            card.paste(fill.resize(glyph.size), (x, y), glyph)
+            x += advance
+        return x
+
+    # --- rendering ------------------------------------------------------
+
+    def render(self, result: Dict):
+        """
+        Render one card
+
+        Args:
+            result: Result dict from TweetGenerator (market, team_player, movement)
+
+        Returns:
+            PIL Image
+        """
+        movement = result['movement']
+        direction = movement['direction']
+        family = self._families.resolve_family(result['market'])
+        card = self._background(family, direction).copy()
+        draw = ImageDraw.Draw(card)
+        mood = self.UP_COLOR if direction == 'up' else self.DOWN_COLOR
+
+        draw.text((60, 150), result['market'].upper(), font=self._font(32), fill=(220, 220, 220))
+        draw.text((60, 200), str(result['team_player']), font=self._font(72), fill=self.TEXT_COLOR)
+
+        # Odds line: last -> this
+        x = self._paste_text(card, str(movement['last_week_american']), (60, 330), 120, (200, 200, 200))
+        draw.text((x + 30, 355), '→', font=self._font(90), fill=self.TEXT_COLOR)
+        self._paste_text(card, str(movement['this_week_american']), (x + 150, 330), 120, self.TEXT_COLOR)
+
+        # Change and magnitude
+        change = f"{movement['change_pct']:+.1f}%"
+        self._paste_text(card, change, (60, 520), 80, mood)
+        magnitude = str(movement['magnitude']).upper()
+        draw.rounded_rectangle((self.WIDTH - 420, 530, self.WIDTH - 60, 600), radius=12, fill=mood)
+        draw.text((self.WIDTH - 400, 545), magnitude, font=self._font(40), fill=self.TEXT_COLOR)
+
+        return card
+
+    def render_png(self, result: Dict) -> bytes:
+        """Render one card as PNG bytes"""
+        buffer = io.BytesIO()
+        self.render(result).save(buffer, format='PNG', optimize=False)
+        return buffer.getvalue()
+
+
+# --- renderer and pool caches -------------------------------------------
+
+_renderers = {}
+_pool = None
+_pool_workers = None
+_cache_lock = threading.Lock()
+
+
+def get_renderer(font_path: str = None, logo_path: str = None, template_folder: str = None) -> ShareCardRenderer:
+    """Renderer for these settings, kept for the life of the process so its layer caches are reused"""
+    key = (font_path, logo_path, template_folder)
+    with _cache_lock:
+        renderer = _renderers.get(key)
+        if renderer is None:
+            renderer = _renderers[key] = ShareCardRenderer(font_path, logo_path, template_folder)
+        return renderer
+
+
+def _get_pool(workers: Optional[int]) -> ProcessPoolExecutor:
+    """
+    Long-lived render pool
+
+    Processes are started with 'spawn': forking a threaded web worker would
+    copy its held locks and background threads into the children. The pool
+    (and each process's renderer caches) is reused by later batches.
+    """
+    global _pool, _pool_workers
+    with _cache_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            _pool_workers = workers
+        return _pool
+
+
+def _render_in_worker(settings: tuple, result: Dict) -> bytes:
+    return get_renderer(*settings).render_png(result)
+
+
+def card_filename(index: int, result: Dict) -> str:
+    """Stable, filesystem-safe card name"""
+    slug = re.sub(r'[^a-z0-9]+', '-', f"{result['market']} {result['team_player']}".lower()).strip('-')
+    return f'{index + 1:02d}_{slug}.png'
+
+
+def render_cards(results: List[Dict], font_path: str = None, logo_path: str = None,
+                 template_folder: str = None, workers: int = None, min_parallel: int = 8) -> List[bytes]:
+    """
+    Render cards for all results, in parallel for larger batches
+
+    Args:
+        results: Result dicts from TweetGenerator
+        font_path: TrueType font path
+        logo_path: Optional logo path
+        template_folder: Template folder for market family routing
+        workers: Max pool processes (defaults to CPU count)
+        min_parallel: Below this many cards, render in-process
+
+    Returns:
+        PNG bytes per result, in input order
+    """
+    payload = [
+        {'market': r['market'], 'team_player': r['team_player'], 'movement': r['movement']}
+        for r in results
+    ]
+    settings = (font_path, logo_path, template_folder)
+    if len(payload) < min_parallel or workers == 1:
+        renderer = get_renderer(*settings)
+        return [renderer.render_png(r) for r in payload]
+
+    executor = _get_pool(workers)
+    chunksize = max(1, len(payload) // ((workers or os.cpu_count() or 1) * 4))
+    return list(executor.map(_render_in_worker, [settings] * len(payload), payload, chunksize=chunksize))
+
+
+def write_bundle(export_data: Dict, target, font_path: str = None, logo_path: str = None,
+                 template_folder: str = None, workers: int = None) -> None:
+    """
+    Write an export bundle: tweets.json plus one card per mover
+
+    Args:
+        export_data: Export dict (as returned by /api/export) with 'results'
+        target: Zip file path or writable binary file object
+        font_path: TrueType font path
+        logo_path: Optional logo path
+        template_folder: Template folder for market family routing
+        workers: Max pool processes
+    """
+    results = export_data['results']
+    cards = render_cards(results, font_path, logo_path, template_folder, workers)
+
+    with zipfile.ZipFile(target, 'w', compression=zipfile.ZIP_DEFLATED) as bundle:
+        bundle.writestr('tweets.json', json.dumps(export_data, indent=2, ensure_ascii=False, default=str))
+        for index, (result, png) in enumerate(zip(results, cards)):
+            # PNGs are already compressed
+            bundle.writestr(f'cards/{card_filename(index, result)}', png, compress_type=zipfile.ZIP_STORED)
@@ -0,0 +1,126 @@
+"""
+Single Flight Module
+Coalesces identical concurrent computations and bounds how much work runs at once
+"""
+import math
+import threading
+import time
+from typing import Any, Callable, Hashable
+
+
+class OverloadedError(Exception):
+    """Raised when too much work is already queued"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f'Server busy, retry in {retry_after}s')
+        self.retry_after = retry_after
+
+
+class _Call:
+    """One in-flight computation shared by every caller with the same key"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Run each keyed computation at most once at a time
+
+    The first caller for a key (the leader) runs the computation; callers
+    that arrive with the same key while it is running wait for and share
+    its result. Leaders take a slot from a bounded pool; when running plus
+    queued leaders would exceed the limit, new work is rejected with
+    OverloadedError so the caller can answer 429.
+    """
+
+    def __init__(self, max_concurrent: int = 4, max_queued: int = 16, timeout: float = 30.0):
+        """
+        Initialize single-flight group
+
+        Args:
+            max_concurrent: Computations allowed to run at once
+            max_queued: Computations allowed to wait for a slot
+            timeout: Max seconds to wait for a slot or a shared result
+        """
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._pending = 0
+        self._avg_duration = 0.5
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn, or wait for an identical in-flight call to finish
+
+        Args:
+            key: Identity of the computation
+            fn: Zero-argument callable doing the work
+
+        Returns:
+            Result of fn (shared between coalesced callers - treat as read-only)
+
+        Raises:
+            OverloadedError: Too much work queued, or waited longer than timeout
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                if self._pending >= self.max_concurrent + self.max_queued:
+                    raise OverloadedError(self.retry_after())
+                call = _Call()
+                self._calls[key] = call
+                self._pending += 1
+
+        if not leader:
+            if not call.done.wait(self.timeout):
+                raise OverloadedError(self.retry_after())
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            if not self._slots.acquire(timeout=self.timeout):
+                raise OverloadedError(self.retry_after())
+            try:
+                started = time.monotonic()
+                call.result = fn()
+                self._record_duration(time.monotonic() - started)
+            finally:
+                self._slots.release()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self._calls.pop(key, None)
+            call.done.set()
+
+        return call.result
+
+    def _record_duration(self, seconds: float) -> None:
+        """Exponential moving average of computation time"""
+        self._avg_duration = 0.8 * self._avg_duration + 0.2 * seconds
+
+    def retry_after(self) -> int:
+        """Seconds a rejected client should wait, estimated from queue depth"""
+        waves = max(self._pending, 1) / self.max_concurrent
+        return max(1, math.ceil(waves * self._avg_duration))
+
+    def stats(self) -> dict:
+        """Current in-flight/queued counts"""
+        with self._lock:
+            return {
+                'in_flight_keys': len(self._calls),
+                'pending': self._pending,
+                'max_concurrent': self.max_concurrent,
+                'max_queued': self.max_queued
+            }
@@ -0,0 +1,288 @@
+"""
+Template Registry Module
+Loads tweet template families from JSON/YAML files with validation and hot reload
+"""
+import json
+import os
+import string
+import threading
+import time
+from typing import Dict, List, Optional
+
+from .templates import TweetTemplates
+
+try:
+    import yaml
+except ImportError:  # YAML files are optional
+    yaml = None
+
+
+class TemplateRegistry:
+    """
+    File-backed registry of tweet template families
+
+    Built-in families come from TweetTemplates. Files in the template folder
+    add new families or override built-ins by name. routing.json maps market
+    names to families; unmapped markets fall back to the built-in substring rules
+    and the result is memoized so routing stays a dict lookup.
+    """
+
+    ROUTING_FILE = 'routing.json'
+    DIRECTIONS = ('riser', 'faller')
+    ALLOWED_FIELDS = {
+        'emoji', 'emoji2', 'team_emoji', 'team', 'player', 'team_player',
+        'market', 'last_odds', 'this_odds', 'change', 'context'
+    }
+    BUILTIN_FAMILIES = {
+        'playoffs': TweetTemplates.PLAYOFFS_TEMPLATES,
+        'mvp': TweetTemplates.MVP_TEMPLATES,
+        'championship': TweetTemplates.CHAMPIONSHIP_TEMPLATES,
+        'generic': TweetTemplates.GENERIC_TEMPLATES,
+    }
+    DEFAULT_FAMILY = 'generic'
+
+    def __init__(self, folder: str = None, reload_interval: float = 2.0):
+        """
+        Initialize registry
+
+        Args:
+            folder: Folder containing template family files and routing.json
+            reload_interval: Min seconds between mtime checks on the render path
+        """
+        self.folder = folder
+        self.reload_interval = reload_interval
+        self.errors = []
+
+        self._lock = threading.Lock()
+        self._families = {}
+        self._file_families = {}
+        self._mtimes = {}
+        self._routes = {}
+        self._resolved = {}
+        self._last_check = 0.0
+        self.version = 0  # Bumped whenever loaded templates change
+
+        for family, templates in self.BUILTIN_FAMILIES.items():
+            self._families[family] = self._compile(family, templates)
+        self.reload(force=True)
+
+    def get_templates(self, market: str, direction: str) -> List[Dict]:
+        """
+        Get compiled templates for a market and direction
+
+        Args:
+            market: Market name (e.g., "To Make The Playoffs")
+            direction: "riser"/"faller" or "up"/"down"
+
+        Returns:
+            List of template dictionaries
+        """
+        self.reload()
+
+        direction = direction.lower()
+        if direction not in self.DIRECTIONS:
+            direction = 'riser' if direction == 'up' else 'faller'
+
+        family = self.resolve_family(market)
+        templates = self._families.get(family, {}).get(direction)
+        if templates:
+            return templates
+        return self._families[self.DEFAULT_FAMILY].get(direction, [])
+
+    def resolve_family(self, market: str) -> str:
+        """
+        Resolve market name to a template family
+
+        Args:
+            market: Market name
+
+        Returns:
+            Template family name
+        """
+        key = market.strip().lower()
+        family = self._resolved.get(key)
+        if family is None:
+            family = self._routes.get(key) or self._builtin_family(key)
+            self._resolved[key] = family
+        return family
+
+    def _builtin_family(self, market_lower: str) -> str:
+        """Substring routing used by TweetTemplates for unmapped markets"""
+        if 'playoff' in market_lower:
+            return 'playoffs'
+        if 'mvp' in market_lower:
+            return 'mvp'
+        if any(x in market_lower for x in ['super bowl', 'conference', 'champion']):
+            return 'championship'
+        return self.DEFAULT_FAMILY
+
+    def families(self) -> List[str]:
+        """List available template family names"""
+        return sorted(self._families)
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Reload files whose mtime changed since the last load
+
+        Args:
+            force: Skip the reload interval check
+
+        Returns:
+            True if anything was reloaded
+        """
+        now = time.monotonic()
+        if not force and now - self._last_check < self.reload_interval:
+            return False
+        if self.folder is None or not os.path.isdir(self.folder):
+            self._last_check = now
+            return False
+
+        with self._lock:
+            self._last_check = now
+            current = self._scan()
+            if current == self._mtimes:
+                return False
+
+            changed = [p for p, m in current.items() if self._mtimes.get(p) != m]
+            removed = [p for p in self._mtimes if p not in current]
+
+            for path in removed:
+                self._drop_file(path)
+            for path in changed:
+                if os.path.basename(path) == self.ROUTING_FILE:
+                    self._load_routing(path)
+                else:
+                    self._load_family(path)
+
+            self._mtimes = current
+            self._resolved = {}
+            self.version += 1
+            return True
+
+    def _scan(self) -> Dict[str, float]:
+        """Collect mtimes of all template files in the folder"""
+        extensions = ('.json', '.yaml', '.yml') if yaml is not None else ('.json',)
+        mtimes = {}
+        for name in os.listdir(self.folder):
+            if name.lower().endswith(extensions):
+                path = os.path.join(self.folder, name)
+                mtimes[path] = os.path.getmtime(path)
+        return mtimes
+
+    def _read(self, path: str) -> Optional[Dict]:
+        """Parse a JSON or YAML file, recording errors"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                if path.lower().endswith('.json'):
+                    return json.load(f)
+                return yaml.safe_load(f)
+        except Exception as e:
+            self.errors.append(f"{os.path.basename(path)}: failed to parse ({str(e)})")
+            return None
+
+    def _load_routing(self, path: str) -> None:
+        """Load market -> family mapping table"""
+        data = self._read(path)
+        if data is None:
+            return
+        routes = data.get('routes', {})
+        if not isinstance(routes, dict):
+            self.errors.append(f"{self.ROUTING_FILE}: 'routes' must be an object")
+            return
+        self._routes = {market.strip().lower(): family for market, family in routes.items()}
+
+    def _load_family(self, path: str) -> None:
+        """Load, validate and compile one template family file"""
+        data = self._read(path)
+        if data is None:
+            return
+
+        family = data.get('family') or os.path.splitext(os.path.basename(path))[0]
+        templates = {d: data.get(d, []) for d in self.DIRECTIONS}
+        try:
+            compiled = self._compile(family, templates)
+        except ValueError as e:
+            # Keep serving the previous version of this family
+            self.errors.append(f"{os.path.basename(path)}: {str(e)}")
+            return
+
+        self._file_families[path] = family
+        self._families[family] = compiled
+
+    def _drop_file(self, path: str) -> None:
+        """Forget a deleted file, restoring the built-in family if it overrode one"""
+        if os.path.basename(path) == self.ROUTING_FILE:
+            self._routes = {}
+            return
+        family = self._file_families.pop(path, None)
+        if family is None:
+            return
+        if family in self.BUILTIN_FAMILIES:
+            self._families[family] = self._compile(family, self.BUILTIN_FAMILIES[family])
+        else:
+            self._families.pop(family, None)
+
+    def _compile(self, family: str, templates: Dict) -> Dict[str, List[Dict]]:
+        """
+        Validate template definitions once so rendering never hits a bad key
+
+        Args:
+            family: Family name (for error messages)
+            templates: Dict of direction -> list of {'name', 'template'}
+
+        Returns:
+            Dict of direction -> list of compiled template dicts
+        """
+        formatter = string.Formatter()
+        compiled = {}
+        for direction in self.DIRECTIONS:
+            entries = templates.get(direction) or []
+            if not isinstance(entries, list):
+                raise ValueError(f"'{direction}' must be a list of templates")
+
+            compiled[direction] = []
+            for entry in entries:
+                if not isinstance(entry, dict) or 'name' not in entry or 'template' not in entry:
+                    raise ValueError(f"{family}/{direction}: each template needs 'name' and 'template'")
+                try:
+                    fields = {f for _, f, _, _ in formatter.parse(entry['template']) if f}
+                except ValueError as e:
+                    raise ValueError(f"{family}/{entry['name']}: {str(e)}")
+                unknown = fields - self.ALLOWED_FIELDS
+                if unknown:
+                    raise ValueError(
+                        f"{family}/{entry['name']}: unknown fields {', '.join(sorted(unknown))}"
+                    )
+                compiled[direction].append({
+                    'name': entry['name'],
+                    'template': entry['template'],
+                    'fields': frozenset(fields)
+                })
+        return compiled
+
+    def get_errors(self) -> List[str]:
+        """Get template load/validation errors"""
+        return self.errors
+
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(folder: str = None, reload_interval: float = 2.0) -> TemplateRegistry:
+    """
+    Get the process-wide template registry for a folder, creating it on first use
+
+    Args:
+        folder: Template folder (None for built-in templates only)
+        reload_interval: Min seconds between mtime checks
+
+    Returns:
+        TemplateRegistry shared by every caller with the same folder and interval
+    """
+    key = (os.path.abspath(folder) if folder else None, reload_interval)
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = _registries[key] = TemplateRegistry(folder, reload_interval)
+        return registry
@@ -2,104 +2,204 @@
 Tweet Generator Module
 Generates tweet content using templates and mover data
 """
+import hashlib
+import json
 from typing import Dict, List
 import pandas as pd
 from .templates import TweetTemplates
+from .template_registry import get_registry
+from .profiling import profile_stage
 
 
 class TweetGenerator:
     """Generate tweet drafts for odds movers"""
 
-    def __init__(self, config: Dict):
+    # Mover fields that feed a rendered result
+    FINGERPRINT_FIELDS = [
+        'market', 'team_player', 'last_week_pct', 'this_week_pct', 'change_pct',
+        'last_week_american', 'this_week_american', 'direction', 'category', 'magnitude'
+    ]
+
+    def __init__(self, config: Dict, context_fetcher=None, draft_index=None, source_id: str = None,
+                 result_cache=None):
         """
         Initialize generator with configuration
 
         Args:
             config: Configuration dictionary
+            context_fetcher: Optional ContextFetcher used for movers without supplied context
+            draft_index: Optional DraftIndex of past drafts (near-duplicate checks, variation rotation)
+            source_id: Fingerprint of the board being generated (excluded from draft_index lookups)
+            result_cache: Optional ResultCache; batches only render movers whose fingerprint changed
         """
         self.config = config
+        self.context_fetcher = context_fetcher
+        self.draft_index = draft_index
+        self.source_id = source_id
+        self.result_cache = result_cache
+        self.batch_stats = {'rendered': 0, 'reused': 0}
         self.include_emojis = config.get('include_emojis', True)
         self.character_limit = config.get('character_limit', 280)
         self.tweet_variations = config.get('tweet_variations', 2)
+        self.template_registry = get_registry(
+            config.get('template_folder'),
+            config.get('template_reload_interval', 2.0)
+        )
 
-    def generate_for_mover(self, mover: Dict, context: str = None) -> Dict:
+    def generate_for_mover(self, mover: Dict, context: str = None, flag_duplicates: bool = True) -> Dict:
         """
         Generate tweet drafts for a single mover
 
         Args:
             mover: Dictionary with mover data
             context: Optional context string to include
+            flag_duplicates: Check drafts against the draft index
 
         Returns:
             Dictionary with mover info and tweet drafts
         """
-        # Extract mover data
-        market = mover['market']
-        team_player = mover['team_player']
-        direction = mover['category']  # 'riser' or 'faller'
-        change_pct = mover['change_pct']
-        magnitude = mover['magnitude']
+        result = self.describe_mover(mover, context)
+
+        # Generate tweet variations
+        result['tweet_drafts'] = [
+            self.render_draft(mover, template_data, result['context_used'], flag_duplicates)
+            for template_data in self.get_mover_templates(mover)
+        ]
 
-        # Format odds
-        last_odds = self._format_american_odds(mover['last_week_american'])
-        this_odds = self._format_american_odds(mover['this_week_american'])
+        return result
 
-        # Get templates
-        templates = TweetTemplates.get_templates(market, direction)
+    def describe_mover(self, mover: Dict, context: str = None) -> Dict:
+        """
+        Build mover info (movement block and context) without rendering drafts
 
-        # Limit to configured number of variations
-        templates = templates[:self.tweet_variations]
+        Args:
+            mover: Dictionary with mover data
+            context: Optional context string to include
 
+        Returns:
+            Dictionary with mover info
+        """
         # Generate context
         if context is None:
             context = self._generate_placeholder_context(mover)
 
-        # Generate tweet variations
-        tweet_drafts = []
-        for template_data in templates:
-            tweet_content = self._fill_template(
-                template_data['template'],
-                mover=mover,
-                market=market,
-                team_player=team_player,
-                last_odds=last_odds,
-                this_odds=this_odds,
-                change=change_pct,
-                context=context
-            )
-
-            # Count characters
-            char_count = len(tweet_content)
-
-            # Check if over limit
-            within_limit = char_count <= self.character_limit
-
-            tweet_drafts.append({
-                'version': template_data['name'],
-                'content': tweet_content,
-                'character_count': char_count,
-                'within_limit': within_limit
-            })
-
-        # Build result
-        result = {
-            'market': market,
-            'team_player': team_player,
+        return {
+            'market': mover['market'],
+            'team_player': mover['team_player'],
             'movement': {
                 'last_week_pct': round(mover['last_week_pct'], 2),
                 'this_week_pct': round(mover['this_week_pct'], 2),
-                'change_pct': round(change_pct, 2),
+                'change_pct': round(mover['change_pct'], 2),
                 'direction': mover['direction'],
-                'magnitude': magnitude,
-                'last_week_american': last_odds,
-                'this_week_american': this_odds
+                'magnitude': mover['magnitude'],
+                'last_week_american': self._format_american_odds(mover['last_week_american']),
+                'this_week_american': self._format_american_odds(mover['this_week_american'])
             },
-            'context_used': context,
-            'tweet_drafts': tweet_drafts
+            'context_used': context
         }
 
-        return result
+    def get_mover_templates(self, mover: Dict) -> List[Dict]:
+        """
+        Get the templates used for a mover, limited to configured variations
+
+        Args:
+            mover: Dictionary with mover data
+
+        Returns:
+            List of template dictionaries
+        """
+        templates = self.template_registry.get_templates(mover['market'], mover['category'])
+
+        # Prefer versions least recently exported for this team/market (never used first)
+        if self.draft_index is not None:
+            last_used = self.draft_index.last_used(mover['market'], mover['team_player'], self.source_id)
+            if last_used:
+                templates = sorted(templates, key=lambda t: last_used.get(t['name'], 0))
+
+        return templates[:self.tweet_variations]
+
+    def render_draft(self, mover: Dict, template_data: Dict, context: str, flag_duplicates: bool = True) -> Dict:
+        """
+        Render one tweet draft for a mover
+
+        Args:
+            mover: Dictionary with mover data
+            template_data: Template dictionary ('name' and 'template')
+            context: Context string to include
+            flag_duplicates: Check the draft against the draft index
+
+        Returns:
+            Draft dictionary with content and character count
+        """
+        tweet_content = self._fill_template(
+            template_data['template'],
+            mover=mover,
+            market=mover['market'],
+            team_player=mover['team_player'],
+            last_odds=self._format_american_odds(mover['last_week_american']),
+            this_odds=self._format_american_odds(mover['this_week_american']),
+            change=mover['change_pct'],
+            context=context
+        )
+
+        # Count characters
+        char_count = len(tweet_content)
+
+        draft = {
+            'version': template_data['name'],
+            'content': tweet_content,
+            'character_count': char_count,
+            'within_limit': char_count <= self.character_limit
+        }
 
+        # Flag copy that is nearly identical to something already exported
+        if flag_duplicates and self.draft_index is not None:
+            draft['near_duplicate'] = self.draft_index.query(tweet_content, exclude_source=self.source_id)
+
+        return draft
+
+    def flag_duplicates(self, result: Dict) -> Dict:
+        """
+        Copy of a result with each draft checked against the draft index as it is now
+
+        Args:
+            result: Result dictionary (not modified, it may be shared by the result cache)
+
+        Returns:
+            Result dictionary with near_duplicate set on every draft
+        """
+        if self.draft_index is None:
+            return result
+        flagged = dict(result)
+        flagged['tweet_drafts'] = [
+            dict(draft, near_duplicate=self.draft_index.query(draft['content'], exclude_source=self.source_id))
+            for draft in result['tweet_drafts']
+        ]
+        return flagged
+
+    def resolve_contexts(self, mover_dicts: List[Dict], contexts: Dict = None) -> Dict:
+        """
+        Merge supplied contexts with fetched ones for movers that have none
+
+        Args:
+            mover_dicts: List of mover dictionaries
+            contexts: Optional dict mapping team_player -> context string
+
+        Returns:
+            Dict mapping team_player -> context string (supplied contexts win)
+        """
+        contexts = dict(contexts or {})
+
+        # Fetch missing contexts for the whole batch up front (concurrently)
+        if self.context_fetcher is not None:
+            missing = [m for m in mover_dicts if m['team_player'] not in contexts]
+            fetched = self.context_fetcher.fetch_batch(missing)
+            if fetched:
+                contexts = {**fetched, **contexts}
+
+        return contexts
+
+    @profile_stage('generate_batch')
     def generate_batch(self, movers: pd.DataFrame, contexts: Dict = None) -> List[Dict]:
         """
         Generate tweets for multiple movers
@@ -112,21 +212,63 @@ class TweetGenerator:
             List of result dictionaries
         """
         results = []
+        mover_dicts = movers.to_dict('records')
+        contexts = self.resolve_contexts(mover_dicts, contexts)
+        self.batch_stats = {'rendered': 0, 'reused': 0}
 
-        for _, mover in movers.iterrows():
-            mover_dict = mover.to_dict()
-            team_player = mover_dict['team_player']
-
+        for mover_dict in mover_dicts:
             # Get context if provided
-            context = None
-            if contexts and team_player in contexts:
-                context = contexts[team_player]
-
-            result = self.generate_for_mover(mover_dict, context)
-            results.append(result)
+            context = contexts.get(mover_dict['team_player'])
+
+            # Reuse the previous render when nothing that shapes it changed
+            if self.result_cache is None:
+                results.append(self.generate_for_mover(mover_dict, context))
+                self.batch_stats['rendered'] += 1
+                continue
+
+            key = self.result_fingerprint(mover_dict, context)
+            result = self.result_cache.get(key)
+            if result is None:
+                # Cached renders don't carry near-duplicate flags: those depend on the
+                # board and the index contents, so they're checked on every batch
+                result = self.generate_for_mover(mover_dict, context, flag_duplicates=False)
+                self.batch_stats['rendered'] += 1
+                self.result_cache.put(key, result)
+            else:
+                self.batch_stats['reused'] += 1
+            results.append(self.flag_duplicates(result))
 
         return results
 
+    def result_fingerprint(self, mover: Dict, context: str = None) -> str:
+        """
+        Fingerprint of everything that shapes a mover's result
+
+        Covers the mover row, its context, the loaded template version, the
+        render settings and, with a draft index, the variation rotation
+        (which versions were last exported for this team/market). Near-duplicate
+        flags are not part of a cached result (see flag_duplicates).
+
+        Args:
+            mover: Dictionary with mover data
+            context: Context string (None for the placeholder)
+
+        Returns:
+            Hex digest
+        """
+        self.template_registry.reload()
+        rotation = self.draft_index.last_used(mover['market'], mover['team_player'], self.source_id) \
+            if self.draft_index is not None else None
+        payload = {
+            'mover': [mover.get(field) for field in self.FINGERPRINT_FIELDS],
+            'context': context,
+            'templates': [self.config.get('template_folder'), self.template_registry.version],
+            'settings': [self.include_emojis, self.character_limit, self.tweet_variations],
+            'rotation': rotation
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha1(encoded).hexdigest()
+
     def _fill_template(self, template: str, **kwargs) -> str:
         """
         Fill template with data
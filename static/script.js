@@ -6,9 +6,24 @@ const state = {
     moversAnalyzed: false,
     tweetsGenerated: false,
     currentMovers: [],
-    currentResults: []
+    currentResults: [],
+    // Server-side paged movers table
+    moversPage: {
+        rows: [],
+        total: 0,
+        nextCursor: null,
+        loading: false,
+        markets: [],
+        query: { sort: 'abs_change', order: 'desc', market: '', direction: '' }
+    }
 };
 
+// Movers table virtualization settings
+const MOVERS_PAGE_SIZE = 100;
+const MOVER_ROW_HEIGHT = 49;
+const MOVERS_VIEWPORT_HEIGHT = 490;
+const MOVERS_OVERSCAN = 8;
+
 // DOM Elements
 const fileInput = document.getElementById('file-input');
 const uploadBtn = document.getElementById('upload-btn');
@@ -89,17 +104,18 @@ async function analyzeMovers() {
             headers: {
                 'Content-Type': 'application/json'
             },
-            body: JSON.stringify({ threshold, top_n: topN })
+            body: JSON.stringify({ threshold, top_n: topN, limit: MOVERS_PAGE_SIZE, ...state.moversPage.query })
         });
 
         const data = await response.json();
 
         if (data.success) {
-            showStatus(analyzeStatus, `✓ Found ${data.movers.length} significant movers`, 'success');
+            showStatus(analyzeStatus, `✓ Found ${data.total} significant movers`, 'success');
             displayMoversSummary(data.summary);
-            displayMoversTable(data.movers);
+            state.moversPage.markets = data.markets;
+            resetMoversPage(data);
+            displayMoversTable();
             state.moversAnalyzed = true;
-            state.currentMovers = data.movers;
             generateBtn.disabled = false;
         } else {
             showStatus(analyzeStatus, `Error: ${data.error}`, 'error');
@@ -235,38 +251,169 @@ function displayMoversSummary(summary) {
     moversSummary.classList.remove('hidden');
 }
 
-function displayMoversTable(movers) {
+function resetMoversPage(data) {
+    state.moversPage.rows = data.movers;
+    state.moversPage.total = data.total;
+    state.moversPage.nextCursor = data.next_cursor;
+    state.currentMovers = state.moversPage.rows;
+}
+
+// Fetch the next page of movers from the server (cursor pagination)
+async function loadMoreMovers() {
+    const page = state.moversPage;
+    if (page.loading || !page.nextCursor) return;
+
+    page.loading = true;
+    try {
+        const params = new URLSearchParams({ ...page.query, limit: MOVERS_PAGE_SIZE, cursor: page.nextCursor });
+        const response = await fetch(`/api/movers?${params}`);
+        const data = await response.json();
+
+        if (data.success) {
+            page.rows = page.rows.concat(data.movers);
+            page.nextCursor = data.next_cursor;
+            state.currentMovers = page.rows;
+            renderVisibleMovers();
+        } else {
+            showStatus(analyzeStatus, `Error: ${data.error}`, 'error');
+        }
+    } catch (error) {
+        showStatus(analyzeStatus, `Loading movers failed: ${error.message}`, 'error');
+    } finally {
+        page.loading = false;
+    }
+}
+
+// Re-query from the first page after a sort/filter change
+async function requeryMovers() {
+    const page = state.moversPage;
+    const params = new URLSearchParams({ ...page.query, limit: MOVERS_PAGE_SIZE });
+
+    try {
+        const response = await fetch(`/api/movers?${params}`);
+        const data = await response.json();
+
+        if (data.success) {
+            resetMoversPage(data);
+            document.getElementById('movers-viewport').scrollTop = 0;
+            updateSortIndicators();
+            renderVisibleMovers();
+        } else {
+            showStatus(analyzeStatus, `Error: ${data.error}`, 'error');
+        }
+    } catch (error) {
+        showStatus(analyzeStatus, `Loading movers failed: ${error.message}`, 'error');
+    }
+}
+
+function sortMovers(sort) {
+    const query = state.moversPage.query;
+    if (query.sort === sort) {
+        query.order = query.order === 'asc' ? 'desc' : 'asc';
+    } else {
+        query.sort = sort;
+        query.order = (sort === 'market' || sort === 'team_player') ? 'asc' : 'desc';
+    }
+    requeryMovers();
+}
+
+function filterMovers() {
+    state.moversPage.query.market = document.getElementById('movers-market-filter').value;
+    state.moversPage.query.direction = document.getElementById('movers-direction-filter').value;
+    requeryMovers();
+}
+
+function updateSortIndicators() {
+    const query = state.moversPage.query;
+    moversTable.querySelectorAll('th[data-sort]').forEach(th => {
+        const arrow = th.dataset.sort === query.sort ? (query.order === 'asc' ? ' ▲' : ' ▼') : '';
+        th.textContent = th.dataset.label + arrow;
+    });
+}
+
+function displayMoversTable() {
+    const query = state.moversPage.query;
     const tableHTML = `
         <h3>Top Movers</h3>
-        <table>
-            <thead>
-                <tr>
-                    <th>Market</th>
-                    <th>Team/Player</th>
-                    <th>Last Week</th>
-                    <th>This Week</th>
-                    <th>Change</th>
-                    <th>Direction</th>
-                    <th>Magnitude</th>
-                </tr>
-            </thead>
-            <tbody>
-                ${movers.map(mover => `
+        <div class="table-filters">
+            <select id="movers-market-filter">
+                <option value="">All markets</option>
+                ${state.moversPage.markets.map(market => `
+                    <option value="${escapeHtml(market)}" ${market === query.market ? 'selected' : ''}>${escapeHtml(market)}</option>
+                `).join('')}
+            </select>
+            <select id="movers-direction-filter">
+                <option value="">Risers &amp; fallers</option>
+                <option value="up" ${query.direction === 'up' ? 'selected' : ''}>Risers</option>
+                <option value="down" ${query.direction === 'down' ? 'selected' : ''}>Fallers</option>
+            </select>
+        </div>
+        <div id="movers-viewport" class="table-viewport" style="max-height: ${MOVERS_VIEWPORT_HEIGHT}px;">
+            <table>
+                <thead>
                     <tr>
-                        <td>${mover.market}</td>
-                        <td><strong>${mover.team_player}</strong></td>
-                        <td>${mover.last_week_american}</td>
-                        <td>${mover.this_week_american}</td>
-                        <td><strong>${mover.change_pct > 0 ? '+' : ''}${mover.change_pct.toFixed(2)}%</strong></td>
-                        <td><span class="badge badge-${mover.direction}">${mover.direction.toUpperCase()}</span></td>
-                        <td><span class="badge badge-${mover.magnitude}">${mover.magnitude}</span></td>
+                        <th class="sortable" data-sort="market" data-label="Market">Market</th>
+                        <th class="sortable" data-sort="team_player" data-label="Team/Player">Team/Player</th>
+                        <th>Last Week</th>
+                        <th class="sortable" data-sort="odds" data-label="This Week">This Week</th>
+                        <th class="sortable" data-sort="abs_change" data-label="Change">Change</th>
+                        <th>Direction</th>
+                        <th>Magnitude</th>
                     </tr>
-                `).join('')}
-            </tbody>
-        </table>
+                </thead>
+                <tbody id="movers-tbody"></tbody>
+            </table>
+        </div>
     `;
     moversTable.innerHTML = tableHTML;
     moversTable.classList.remove('hidden');
+
+    moversTable.querySelectorAll('th[data-sort]').forEach(th => {
+        th.addEventListener('click', () => sortMovers(th.dataset.sort));
+    });
+    document.getElementById('movers-market-filter').addEventListener('change', filterMovers);
+    document.getElementById('movers-direction-filter').addEventListener('change', filterMovers);
+    document.getElementById('movers-viewport').addEventListener('scroll', renderVisibleMovers);
+
+    updateSortIndicators();
+    renderVisibleMovers();
+}
+
+// Only the rows inside the scroll viewport are in the DOM; spacer rows keep the scrollbar honest
+function renderVisibleMovers() {
+    const viewport = document.getElementById('movers-viewport');
+    const tbody = document.getElementById('movers-tbody');
+    if (!viewport || !tbody) return;
+
+    const page = state.moversPage;
+    const rows = page.rows;
+    const first = Math.max(0, Math.floor(viewport.scrollTop / MOVER_ROW_HEIGHT) - MOVERS_OVERSCAN);
+    const visibleCount = Math.ceil(MOVERS_VIEWPORT_HEIGHT / MOVER_ROW_HEIGHT) + 2 * MOVERS_OVERSCAN;
+    const last = Math.min(rows.length, first + visibleCount);
+
+    const topSpace = first * MOVER_ROW_HEIGHT;
+    const bottomSpace = (page.total - last) * MOVER_ROW_HEIGHT;
+
+    tbody.innerHTML = `
+        ${topSpace > 0 ? `<tr class="spacer" style="height: ${topSpace}px;"><td colspan="7"></td></tr>` : ''}
+        ${rows.slice(first, last).map(mover => `
+            <tr style="height: ${MOVER_ROW_HEIGHT}px;">
+                <td>${escapeHtml(mover.market)}</td>
+                <td><strong>${escapeHtml(mover.team_player)}</strong></td>
+                <td>${mover.last_week_american}</td>
+                <td>${mover.this_week_american}</td>
+                <td><strong>${mover.change_pct > 0 ? '+' : ''}${mover.change_pct.toFixed(2)}%</strong></td>
+                <td><span class="badge badge-${mover.direction}">${mover.direction.toUpperCase()}</span></td>
+                <td><span class="badge badge-${mover.magnitude}">${mover.magnitude}</span></td>
+            </tr>
+        `).join('')}
+        ${bottomSpace > 0 ? `<tr class="spacer" style="height: ${bottomSpace}px;"><td colspan="7"></td></tr>` : ''}
+    `;
+
+    // Prefetch the next page before the user scrolls past the loaded rows
+    if (last + MOVERS_OVERSCAN >= rows.length) {
+        loadMoreMovers();
+    }
 }
 
 function displayTweets(results) {
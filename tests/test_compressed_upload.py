@@ -0,0 +1,43 @@
+"""
+Tests for compressed upload handling
+"""
+import io
+import zipfile
+
+import pytest
+
+from modules.compressed_upload import open_csv_stream
+
+CSV = b'market,team_player,change_pct\nMVP,Player A,5.0\n'
+
+
+def make_zip(content: bytes = CSV, name: str = 'board.csv') -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+def test_zip_upload_is_decompressed():
+    stream = open_csv_stream(io.BytesIO(make_zip()), 'board.zip')
+    assert stream.read() == CSV
+
+
+def test_malformed_zip_raises_value_error():
+    with pytest.raises(ValueError, match='Invalid zip upload'):
+        open_csv_stream(io.BytesIO(b'not a zip at all'), 'board.zip')
+
+
+def test_truncated_zip_raises_value_error():
+    data = make_zip()
+    with pytest.raises(ValueError, match='Invalid zip upload'):
+        open_csv_stream(io.BytesIO(data[:len(data) // 2]), 'board.zip')
+
+
+def test_corrupt_zip_member_raises_value_error_on_read():
+    content = CSV * 50
+    data = bytearray(make_zip(content))
+    # Flip a byte inside the deflated member data so the CRC check fails
+    data[data.index(b'board.csv') + len('board.csv') + 5] ^= 0xFF
+    with pytest.raises(ValueError):
+        open_csv_stream(io.BytesIO(bytes(data)), 'board.zip').read()
@@ -0,0 +1,76 @@
+"""
+Tests for delta patching of a LiveBoard against a full recompute
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.aggregation import SummaryAggregator
+from modules.live_board import LiveBoard
+from modules.movers_analyzer import MoversAnalyzer
+
+MARKETS = ['To Win AFC', 'To Win NFC', 'MVP', 'Super Bowl Winner']
+THRESHOLD = 2.0
+TOP_N = 15
+
+
+def make_rows(rng: np.random.Generator, players, markets=None) -> pd.DataFrame:
+    """Cleaned board rows with two-decimal changes (plenty of ties)"""
+    n = len(players)
+    last_pct = np.round(rng.uniform(1, 60, n), 2)
+    change = np.round(rng.integers(-1200, 1200, n) / 100, 2)
+    return pd.DataFrame({
+        'market': markets if markets is not None else rng.choice(MARKETS, n),
+        'team_player': players,
+        'last_week_pct': last_pct,
+        'this_week_pct': np.round(last_pct + change, 2),
+        'change_pct': change,
+        'last_week_american': rng.integers(-500, 5000, n),
+        'this_week_american': rng.integers(-500, 5000, n),
+    })
+
+
+def full_summary(df: pd.DataFrame) -> dict:
+    aggregator = SummaryAggregator.from_frame(df)
+    summary = aggregator.board_summary()
+    summary['by_market'] = aggregator.market_breakdown()
+    return summary
+
+
+def full_analysis(df: pd.DataFrame):
+    analyzer = MoversAnalyzer(df, {'movement_threshold': THRESHOLD, 'top_n_movers': TOP_N})
+    movers = analyzer.identify_movers()
+    return movers, analyzer.get_movers_summary()
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_delta_rounds_match_full_recompute(seed):
+    rng = np.random.default_rng(seed)
+    board = make_rows(rng, [f'Team {i:03d}' for i in range(120)])
+    live = LiveBoard(board)
+    live.top_movers(THRESHOLD, TOP_N)  # Ranking is then maintained incrementally
+
+    for round_number in range(6):
+        # Update a sample of existing rows and add a few new ones
+        existing = board.sample(25, random_state=seed * 10 + round_number)
+        updates = make_rows(rng, existing['team_player'].tolist(), existing['market'].tolist())
+        inserts = make_rows(rng, [f'New {round_number}-{i}' for i in range(4)])
+        live.apply(pd.concat([updates, inserts], ignore_index=True))
+
+        patched = live.frame().copy()
+        assert live.board_summary() == full_summary(patched)
+
+        movers, summary = live.analysis(THRESHOLD, TOP_N)
+        expected_movers, expected_summary = full_analysis(patched)
+        assert movers.index.tolist() == expected_movers.index.tolist()
+        assert summary == expected_summary
+
+
+def test_unchanged_rows_keep_board_id():
+    rng = np.random.default_rng(0)
+    board = make_rows(rng, [f'Team {i:03d}' for i in range(20)])
+    live = LiveBoard(board)
+    board_id = live.board_id
+
+    result = live.apply(board.head(5))
+    assert result == {'updated': 0, 'inserted': 0, 'unchanged': 5, 'board_id': board_id}